@@ -1,15 +1,34 @@
 """Configuration for the LLM Council."""
 
 import os
+import atexit
+import logging
+import logging.handlers
+import queue
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# Logging - set LOG_LEVEL=DEBUG to dump full prompts and model responses
+# Records are handed to a queue and written by a listener thread, so logging on
+# the streaming path never blocks the event loop on stdout writes
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(queue.SimpleQueue(), _log_handler)
+_queue_handler = logging.handlers.QueueHandler(_log_listener.queue)
+_queue_handler.setFormatter(logging.Formatter("%(message)s"))  # Final format applied by the listener
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper(), handlers=[_queue_handler])
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+# httpx logs every request at INFO; keep it to warnings
+logging.getLogger("httpx").setLevel(logging.WARNING)
+
 # OpenRouter API key
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 
-# Council members - list of OpenRouter model identifiers
-COUNCIL_MODELS = [
+# Council members - immutable tuple of OpenRouter model identifiers
+COUNCIL_MODELS = (
     # "openai/gpt-5.1",
     # "deepseek/deepseek-v3.2-exp",
     "z-ai/glm-4.5-air:free",
@@ -19,18 +38,67 @@ COUNCIL_MODELS = [
     # "google/gemini-3-pro-preview",
     # "anthropic/claude-sonnet-4.5",
     # "x-ai/grok-4",
-]
+)
 
 # Chairman model - synthesizes final response
 # CHAIRMAN_MODEL = "deepseek/deepseek-v3.2-exp"
 CHAIRMAN_MODEL = "z-ai/glm-4.5-air:free"
 
+# Chairmen tried in order when the chairman above fails to respond
+CHAIRMAN_FALLBACK_MODELS = (
+    "tngtech/deepseek-r1t2-chimera:free",
+)
+
 # OpenRouter API endpoint
 OPENROUTER_API_URL = "https://openrouter.ai/api/v1/chat/completions"
 
+# Maximum OpenRouter requests in flight at once, across all conversations
+MAX_CONCURRENT_REQUESTS = int(os.getenv("MAX_CONCURRENT_REQUESTS", "32"))
+
+# Maximum requests in flight per upstream provider (the "openai" in "openai/gpt-4o"),
+# since rate limits are enforced per provider
+MAX_CONCURRENT_PER_PROVIDER = int(os.getenv("MAX_CONCURRENT_PER_PROVIDER", "8"))
+
+# Retries for rate-limited (429) or temporarily unavailable (5xx) responses and for
+# connection failures (connect errors/timeouts, dropped HTTP/2 connections), with
+# exponential backoff starting at RETRY_BACKOFF seconds
+MAX_RETRIES = int(os.getenv("MAX_RETRIES", "2"))
+RETRY_BACKOFF = 1.0
+
+# Opt-in cache of council responses that parsed successfully, reused for identical
+# requests (same model and messages) for RESPONSE_CACHE_TTL seconds. Off by default:
+# a repeated question would otherwise replay the same answers
+RESPONSE_CACHE_SIZE = int(os.getenv("RESPONSE_CACHE_SIZE", "0"))
+RESPONSE_CACHE_TTL = float(os.getenv("RESPONSE_CACHE_TTL", "3600"))
+
 # Data directory for conversation storage
 DATA_DIR = "data/conversations"
 
+# Maximum council rounds per question, including the divergent phase
+MAX_ROUNDS = 5
+
 # Convergence threshold for chairman evaluation
 # Chairman can only set is_converged=true when convergence_score >= this threshold
 CONVERGENCE_THRESHOLD = 0.85
+
+# Candidate agreement thresholds for skipping the chairman
+# A round is treated as converged without a chairman call when at least 3/4 of the
+# council give final_answer_candidate texts within CANDIDATE_AGREEMENT_THRESHOLD
+# (word-set Jaccard similarity) of each other, or when every member answered and
+# all pairs are within CANDIDATE_UNANIMOUS_THRESHOLD
+CANDIDATE_AGREEMENT_THRESHOLD = 0.9
+CANDIDATE_UNANIMOUS_THRESHOLD = 0.7
+
+# Seconds to wait for the last council model once the chairman has started
+# speculatively on the other responses; a later straggler is left out of the round
+CHAIRMAN_SPECULATION_GRACE = 10.0
+
+# Hard limit in seconds for one round of council queries; models still running
+# at the deadline are cancelled and the round continues without them
+ROUND_DEADLINE = float(os.getenv("ROUND_DEADLINE", "150"))
+
+# Once half of the council has answered, the round deadline is tightened to
+# STRAGGLER_DEADLINE_FACTOR times their median response time (but never below
+# STRAGGLER_DEADLINE_MIN seconds), so one slow provider cannot stall the round
+STRAGGLER_DEADLINE_FACTOR = 2.5
+STRAGGLER_DEADLINE_MIN = 30.0
@@ -1,58 +1,103 @@
 """3-stage LLM Council orchestration."""
 
-from typing import List, Dict, Any, Optional
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import combinations
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple, Callable, FrozenSet, NamedTuple
+import asyncio
+import hashlib
 import json
-from .openrouter import query_models_parallel, query_model
-from .config import COUNCIL_MODELS, CHAIRMAN_MODEL, CONVERGENCE_THRESHOLD
-
-
-async def divergent_phase_responses(user_query: str) -> List[Dict[str, Any]]:
+import logging
+import re
+import statistics
+import time
+import orjson
+from .openrouter import (
+    query_models_as_completed,
+    query_model,
+    query_model_stream,
+    start_model_queries,
+    build_cached_user_message,
+    encode_messages,
+)
+from .config import (
+    COUNCIL_MODELS,
+    CHAIRMAN_MODEL,
+    CHAIRMAN_FALLBACK_MODELS,
+    MAX_ROUNDS,
+    CONVERGENCE_THRESHOLD,
+    CANDIDATE_AGREEMENT_THRESHOLD,
+    CANDIDATE_UNANIMOUS_THRESHOLD,
+    CHAIRMAN_SPECULATION_GRACE,
+    ROUND_DEADLINE,
+    STRAGGLER_DEADLINE_FACTOR,
+    STRAGGLER_DEADLINE_MIN,
+    RESPONSE_CACHE_SIZE,
+    RESPONSE_CACHE_TTL,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def divergent_phase_stream(user_query: str) -> AsyncIterator[Dict[str, Any]]:
     """
-    Divergent Phase: responses where each model provides their own perspective without seeing others' responses.
+    Divergent Phase: stream each model's independent perspective as soon as it arrives.
 
     Args:
         user_query: The user's question
 
-    Returns:
-        List of dicts with 'model', 'response', and 'parsed_json' keys
+    Yields:
+        Dicts with 'model', 'response', and 'parsed_json' keys, in completion order
     """
-    divergent_results = []
-
-    # Build prompt for responses (no accumulated context)
-    prompt = build_divergent_prompt(user_query)
+    # Build messages for responses (no accumulated context)
+    messages = build_divergent_messages(user_query)
 
-    # Query all models in parallel for responses
-    responses = await query_models_parallel(COUNCIL_MODELS, [{"role": "user", "content": prompt}])
-
-    # Process responses
-    for model, response in responses.items():
+    # Query all models in parallel and process each response as soon as it arrives
+    async for model, response in query_models_as_completed(COUNCIL_MODELS, messages, ROUND_DEADLINE):
         if response is not None:
-            response_text = response.get('content', '')
+            response_text = response.get('content') or ''
 
             # Log response for debugging
-            print(f"\n=== Response from {model} ===", flush=True)
-            print(f"Response length: {len(response_text)} characters", flush=True)
-            print("Response content:", flush=True)
-            print("-" * 80, flush=True)
-            print(response_text, flush=True)
-            print("-" * 80, flush=True)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Divergent response from %s (%d characters):\n%s",
+                    model, len(response_text), response_text
+                )
 
             # Validate and parse JSON
-            parsed_json = validate_and_parse_json(response_text, model)
+            parsed_json, defaulted_fields = validate_and_parse_json(response_text, model)
 
-            result = {
+            yield {
                 "model": model,
                 "response": response_text,
-                "parsed_json": parsed_json
+                "parsed_json": parsed_json,
+                "defaulted_fields": defaulted_fields
             }
-
-            divergent_results.append(result)
         else:
             # If model fails, continue with next model
-            print(f"Warning: Model {model} failed to respond in divergent phase")
+            logger.warning("Model %s failed to respond in divergent phase", model)
+
+
+async def divergent_phase_responses(user_query: str) -> List[Dict[str, Any]]:
+    """
+    Divergent Phase: responses where each model provides their own perspective without seeing others' responses.
+
+    Args:
+        user_query: The user's question
+
+    Returns:
+        List of dicts with 'model', 'response', and 'parsed_json' keys
+    """
+    return [result async for result in divergent_phase_stream(user_query)]
+
 
-    return divergent_results
 
+# Recently generated titles keyed by normalized query, oldest first
+_TITLE_CACHE: "OrderedDict[str, str]" = OrderedDict()
+_TITLE_CACHE_SIZE = 1024
+
+# Title requests in flight, so concurrent identical questions share one LLM call
+_TITLE_REQUESTS: "Dict[str, asyncio.Task[str]]" = {}
 
 
 async def generate_conversation_title(user_query: str) -> str:
@@ -65,6 +110,34 @@ async def generate_conversation_title(user_query: str) -> str:
     Returns:
         A short title (3-5 words)
     """
+    # Reuse the title of an identical question (ignoring case and spacing)
+    cache_key = " ".join(user_query.lower().split())
+    cached_title = _TITLE_CACHE.get(cache_key)
+    if cached_title is not None:
+        _TITLE_CACHE.move_to_end(cache_key)
+        return cached_title
+
+    request = _TITLE_REQUESTS.get(cache_key)
+    if request is None:
+        request = asyncio.create_task(request_conversation_title(user_query, cache_key))
+        _TITLE_REQUESTS[cache_key] = request
+        request.add_done_callback(lambda _: _TITLE_REQUESTS.pop(cache_key, None))
+
+    # Shield the shared request so one caller going away doesn't cancel it for the others
+    return await asyncio.shield(request)
+
+
+async def request_conversation_title(user_query: str, cache_key: str) -> str:
+    """
+    Ask the title model for a conversation title and cache the result.
+
+    Args:
+        user_query: The first user message
+        cache_key: Normalized query used as the title cache key
+
+    Returns:
+        A short title, or "New Conversation" if the title model failed
+    """
     title_prompt = f"""Generate a very short title (3-5 words maximum) that summarizes the following question.
 The title should be concise and descriptive. Do not use quotes or punctuation in the title.
 
@@ -83,7 +156,7 @@ Title:"""
         # Fallback to a generic title
         return "New Conversation"
 
-    title = response.get('content', 'New Conversation').strip()
+    title = (response.get('content') or 'New Conversation').strip()
 
     # Clean up the title - remove quotes, limit length
     title = title.strip('"\'')
@@ -92,21 +165,15 @@ Title:"""
     if len(title) > 50:
         title = title[:47] + "..."
 
-    return title
-
+    _TITLE_CACHE[cache_key] = title
+    if len(_TITLE_CACHE) > _TITLE_CACHE_SIZE:
+        _TITLE_CACHE.popitem(last=False)
 
-def build_divergent_prompt(user_query: str) -> str:
-    """
-    Build prompt for divergent phase where each model responds without seeing others' responses.
+    return title
 
-    Args:
-        user_query: The user's question
 
-    Returns:
-        Formatted prompt string
-    """
-    # Optimized divergent phase prompt for responses
-    system_prompt = """# Role and Task
+# Static divergent phase instructions, shared by every divergent call
+_DIVERGENT_PROMPT_PREFIX = """# Role and Task
 
 ## Role Definition
 You are an AI model in a multi-agent collaboration system, participating in the divergent phase discussion. You will provide independent viewpoints and cannot see other models' thoughts.
@@ -130,162 +197,387 @@ You are an AI model in a multi-agent collaboration system, participating in the
 Must strictly adhere to the following JSON format:
 
 ```json
-{{
+{
   "summary": "Brief description of your thinking on the question",
   "viewpoints": ["Your main viewpoint 1", "Your main viewpoint 2", "Your main viewpoint 3", ...],
   "final_answer_candidate": "Preliminary answer based on your independent analysis"
-}}
+}
 ```
 
 ---
 
-# User's Original Question
-{user_query}
+# Start Answering
+Please output your independent viewpoints on the user's question below strictly according to the specified JSON format.
 
 ---
 
-# Start Answering
-Please output your independent viewpoints strictly according to the specified JSON format."""
+"""
+
+
+def build_divergent_prompt_prefix() -> str:
+    """
+    Build the stable prefix of the divergent phase prompt.
+
+    The prefix contains no per-request variables, so it is byte-identical across
+    every divergent call and eligible for provider-side prompt caching.
 
-    return system_prompt.format(user_query=user_query)
+    Returns:
+        Static instruction text for the divergent phase
+    """
+    return _DIVERGENT_PROMPT_PREFIX
 
 
-def validate_and_parse_json(response_text: str, model_name: str) -> Dict[str, Any]:
+def build_divergent_prompt_suffix(user_query: str) -> str:
     """
-    Validate and parse JSON response with retry logic.
+    Build the per-request suffix of the divergent phase prompt.
 
     Args:
-        response_text: The raw response text from the model
-        model_name: Name of the model for error reporting
+        user_query: The user's question
 
     Returns:
-        Parsed JSON dict or empty dict if validation fails
+        Prompt text carrying the user's question
     """
-    # Try to parse JSON
-    try:
-        # Remove any markdown code block markers
-        cleaned_text = response_text.strip()
-        if cleaned_text.startswith('```json'):
-            cleaned_text = cleaned_text[7:]
-        if cleaned_text.startswith('```'):
-            cleaned_text = cleaned_text[3:]
-        if cleaned_text.endswith('```'):
-            cleaned_text = cleaned_text[:-3]
-
-        parsed = json.loads(cleaned_text.strip())
-
-        # Validate required fields for convergent phase
-        required_fields = ['summary', 'viewpoints', 'final_answer_candidate']
-
-        # Optional fields for convergent phase analysis
-        optional_fields = ['consensus_analysis', 'conflict_analysis', 'conflicts', 'suggestions']
-
-        for field in required_fields:
-            if field not in parsed:
-                print(f"Warning: Model {model_name} missing required field '{field}' in JSON")
-                # Try to create missing field from available data
-                if field == 'viewpoints' and 'summary' in parsed:
-                    parsed['viewpoints'] = [parsed['summary']]
-                elif field == 'summary' and 'viewpoints' in parsed:
-                    parsed['summary'] = ' '.join(parsed['viewpoints'][:2]) if parsed['viewpoints'] else "No summary provided"
-                else:
-                    parsed[field] = "" if field == 'final_answer_candidate' else []
+    return f"# User's Original Question\n{user_query}"
 
-        # Ensure optional fields exist with appropriate defaults
-        for field in optional_fields:
-            if field not in parsed:
-                if field in ['consensus_analysis', 'conflict_analysis']:
-                    parsed[field] = []  # These should be arrays of objects
-                else:
-                    parsed[field] = []  # conflicts and suggestions should be arrays
 
-        return parsed
+def build_divergent_prompt(user_query: str) -> str:
+    """
+    Build prompt for divergent phase where each model responds without seeing others' responses.
 
-    except json.JSONDecodeError as e:
-        print(f"Warning: Model {model_name} returned invalid JSON: {e}")
-        print(f"Response text: {response_text}")
-        return {}
+    Args:
+        user_query: The user's question
 
+    Returns:
+        Formatted prompt string
+    """
+    return build_divergent_prompt_prefix() + build_divergent_prompt_suffix(user_query)
 
-async def evaluate_convergence(
-    user_query: str,
-    round_responses: List[Dict[str, Any]],
-    round_number: int,
-    previous_chairman_response: Optional[Dict[str, Any]] = None
-) -> Dict[str, Any]:
+
+def build_divergent_messages(user_query: str) -> List[Dict[str, Any]]:
     """
-    Evaluate convergence and generate chairman's assessment.
+    Build the divergent phase messages with the stable prefix marked as cacheable.
 
     Args:
         user_query: The user's question
-        round_responses: List of model responses for this round
-        round_number: Current round number (1 for divergent, 2+ for convergent)
-        previous_chairman_response: Previous round's chairman assessment for context
 
     Returns:
-        Chairman's assessment in JSON format
+        Message list to send to each council model
     """
-    # Build responses text for chairman
-    responses_text = "\n\n".join([
-        f"{result['model']}:\n{result['response']}"
-        for result in round_responses
-    ])
+    return [build_cached_user_message(
+        build_divergent_prompt_prefix(),
+        build_divergent_prompt_suffix(user_query)
+    )]
 
-    # Build previous chairman context section if available
-    previous_chairman_context = ""
-    if previous_chairman_response and round_number > 1:
-        # Format the detailed previous round context for better comparison
-        prev_consensus = previous_chairman_response.get('consensus_points', [])
-        prev_conflicts = previous_chairman_response.get('conflict_points', [])
-        prev_questions = previous_chairman_response.get('questions_for_next_round', [])
-        prev_score = previous_chairman_response.get('convergence_score', 'N/A')
-        prev_converged = previous_chairman_response.get('is_converged', 'N/A')
-        prev_explanation = previous_chairman_response.get('explanation', 'N/A')
 
-        previous_chairman_context = f"""
+class JsonSchema(NamedTuple):
+    """Expected fields of an LLM JSON object."""
 
-## Previous Round Discussion Status Review (Round {round_number-1})
+    # Default factories for absent fields, applied in order (a factory may read
+    # fields filled before it)
+    defaults: Dict[str, Callable[[Dict[str, Any]], Any]]
+    # Fields whose absence is logged as a warning
+    required: FrozenSet[str]
+    # All fields with a default, for the single set difference on the common path
+    fields: FrozenSet[str]
 
-### Previous Round Key Metrics
-- **Convergence Score**: {prev_score}/1.0
-- **Convergence Status**: {prev_converged}
 
-### Previous Round Identified Consensus Points
-{chr(10).join([f"- {point}" for point in prev_consensus]) if prev_consensus else "- No clear consensus points"}
+# Default factories for council model response fields (summary and viewpoints are
+# derived from each other if possible)
+def _default_viewpoints(parsed: Dict[str, Any]) -> List[str]:
+    """
+    Use the model's summary as its only viewpoint, if it wrote a usable one.
 
-### Previous Round Identified Main Conflict Points
-{chr(10).join([f"- {point}" for point in prev_conflicts]) if prev_conflicts else "- No significant conflict points"}
+    Args:
+        parsed: Parsed model response
 
-### Previous Round Proposed Guiding Questions
-{chr(10).join([f"{i+1}. {q}" for i, q in enumerate(prev_questions)]) if prev_questions else "- No specific guiding questions"}
+    Returns:
+        List with the summary, or an empty list
+    """
+    summary = parsed.get('summary')
+    return [summary] if isinstance(summary, str) and summary.strip() else []
 
-### Previous Round Convergence Analysis
-{prev_explanation}
 
-## 🔍 This Round Comparative Analysis Requirements
+def _default_summary(parsed: Dict[str, Any]) -> str:
+    """
+    Summarize by the first two viewpoints, tolerating badly typed values.
 
-**When evaluating this round's discussion, you must perform the following comparative analysis:**
+    Args:
+        parsed: Parsed model response (viewpoints already filled)
 
-### 1. Viewpoint Evolution Comparison
-- **Compare with previous round consensus points**: Has this round reinforced these consensus points? Have there been modifications?
-- **Compare with previous round conflict points**: Has this round resolved these conflicts? Have new conflicts emerged?
-- **New viewpoint identification**: What new viewpoints or angles have appeared in this round that were not in the previous round?
+    Returns:
+        Summary text
+    """
+    viewpoints = parsed.get('viewpoints')
+    if isinstance(viewpoints, list):
+        summary = ' '.join(str(item) for item in viewpoints[:2] if item is not None)
+        if summary.strip():
+            return summary
+    return "No summary provided"
+
+
+MODEL_FIELD_DEFAULTS = {
+    'viewpoints': _default_viewpoints,
+    'summary': _default_summary,
+    'final_answer_candidate': lambda parsed: "",
+    # Convergent phase analysis fields (only read or serialized, so absent ones
+    # share the empty tuple instead of getting a fresh list each)
+    'consensus_analysis': lambda parsed: (),
+    'conflict_analysis': lambda parsed: (),
+    'conflicts': lambda parsed: (),
+    'suggestions': lambda parsed: (),
+}
 
-### 2. Discussion Progress Assessment
-- **Question responsiveness**: Have the responses in this round effectively addressed the guiding questions proposed in the previous round?
-- **Convergence trajectory**: Is the discussion moving toward convergence or have new divergences appeared?
-- **Depth change**: Compared to the previous round, has the depth and breadth of the discussion improved?
+MODEL_SCHEMA = JsonSchema(
+    defaults=MODEL_FIELD_DEFAULTS,
+    required=frozenset({'summary', 'viewpoints', 'final_answer_candidate'}),
+    fields=frozenset(MODEL_FIELD_DEFAULTS),
+)
+
+# Default factories for chairman assessment fields (all of them are required);
+# absent lists share the empty tuple, since assessments are never mutated in place
+CHAIRMAN_FIELD_DEFAULTS = {
+    'convergence_score': lambda parsed: 0.0,
+    'is_converged': lambda parsed: False,
+    'consensus_points': lambda parsed: (),
+    'conflict_points': lambda parsed: (),
+    'explanation': lambda parsed: "",
+    'questions_for_next_round': lambda parsed: (),
+    'final_integrated_conclusion': lambda parsed: "",
+}
 
-### 3. Decision Basis
-- **Stability judgment**: Is this round more stable compared to the previous round (viewpoints no longer changing significantly)?
-- **Sufficiency assessment**: Are the existing consensus points and resolved conflict points sufficient to form a high-quality answer?
-- **Remaining divergence value**: Do the remaining divergence points have a substantial impact on the quality of the final answer?
+CHAIRMAN_SCHEMA = JsonSchema(
+    defaults=CHAIRMAN_FIELD_DEFAULTS,
+    required=frozenset(CHAIRMAN_FIELD_DEFAULTS),
+    fields=frozenset(CHAIRMAN_FIELD_DEFAULTS),
+)
 
-**Special Note**: Convergence does not mean complete agreement, but rather that the discussion framework is stable, divergences are clear and manageable, and a comprehensive high-quality answer can be formed.
-"""
+# Chairman fields that guide the next convergent round
+CHAIRMAN_GUIDANCE_FIELDS = ('consensus_points', 'conflict_points', 'questions_for_next_round')
+
+# Chairman fields that are useful before the full response has streamed in
+CHAIRMAN_EARLY_FIELDS = [
+    'convergence_score', 'is_converged', 'consensus_points',
+    'conflict_points', 'questions_for_next_round'
+]
+
+# Lenient decoder for partial chairman output (allows raw newlines in strings)
+_STREAM_DECODER = json.JSONDecoder(strict=False)
+
+# Word tokens used for lexical similarity between answer candidates
+_WORD_RE = re.compile(r"\w+")
+
+# Characters that can follow a complete scalar value in a JSON object
+_VALUE_DELIMITERS = frozenset(',}] \t\r\n')
+
+# First markdown code fence (```json, ```JSON or bare ```) and its contents
+_FENCE_RE = re.compile(r"```(?:json)?[ \t]*\n?(.*?)\s*```", re.DOTALL | re.IGNORECASE)
+
+# Python literals that models sometimes emit instead of JSON literals
+_PYTHON_LITERALS = {"True": "true", "False": "false", "None": "null"}
+
+# Raw control characters that must be escaped inside JSON strings
+_STRING_ESCAPES = {"\n": "\\n", "\r": "\\r", "\t": "\\t"}
+
+
+def repair_json_text(text: str) -> str:
+    """
+    Deterministically fix common LLM JSON mistakes outside of valid syntax.
+
+    Handles trailing commas before `}`/`]`, Python `True`/`False`/`None`
+    literals, and raw newlines/tabs inside string values.
+
+    Args:
+        text: JSON-like text
+
+    Returns:
+        Repaired text (may still be invalid JSON)
+    """
+    out = []
+    i = 0
+    n = len(text)
+    in_string = False
+
+    while i < n:
+        ch = text[i]
+
+        if in_string:
+            if ch == '\\' and i + 1 < n:
+                out.append(text[i:i + 2])
+                i += 2
+                continue
+            if ch == '"':
+                in_string = False
+            out.append(_STRING_ESCAPES.get(ch, ch))
+            i += 1
+            continue
+
+        if ch == '"':
+            in_string = True
+            out.append(ch)
+            i += 1
+        elif ch == ',':
+            # Drop trailing commas before a closing bracket
+            j = i + 1
+            while j < n and text[j].isspace():
+                j += 1
+            if j >= n or text[j] not in '}]':
+                out.append(ch)
+            i += 1
+        elif ch.isalpha():
+            j = i
+            while j < n and text[j].isalpha():
+                j += 1
+            word = text[i:j]
+            out.append(_PYTHON_LITERALS.get(word, word))
+            i = j
+        else:
+            out.append(ch)
+            i += 1
+
+    return ''.join(out)
+
+
+def loads_llm_json(response_text: str) -> Any:
+    """
+    Parse JSON from an LLM response.
+
+    Tries, in order: the raw text, the outermost `{...}` block (inside the first
+    markdown fence, if any, so prose around the JSON is dropped), and a repaired
+    version of that block.
+
+    Args:
+        response_text: The raw response text from the model
+
+    Returns:
+        Parsed JSON value
+
+    Raises:
+        orjson.JSONDecodeError: If the text cannot be parsed even after repair
+    """
+    try:
+        return orjson.loads(response_text)
+    except orjson.JSONDecodeError:
+        pass
+
+    # Locate the braces by index within the fence (or the whole text), so the
+    # JSON block is the only substring allocated
+    start = end = -1
+    fence = _FENCE_RE.search(response_text)
+    if fence:
+        start = response_text.find('{', fence.start(1), fence.end(1))
+        end = response_text.rfind('}', fence.start(1), fence.end(1))
+    if start == -1 or end < start:
+        start = response_text.find('{')
+        end = response_text.rfind('}')
+    if start == -1 or end < start:
+        # Re-raise the original error for consistent reporting
+        return orjson.loads(response_text)
+
+    json_block = response_text[start:end + 1]
+    try:
+        return orjson.loads(json_block)
+    except orjson.JSONDecodeError:
+        return orjson.loads(repair_json_text(json_block))
+
+
+def load_llm_object(response_text: str, source: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse an LLM's JSON object as written, without schema defaults.
+
+    Args:
+        response_text: The raw response text from the model
+        source: Who produced the response, for logging (e.g. "Model openai/gpt-4o")
+
+    Returns:
+        Parsed JSON dict, or None if the response is not a JSON object
+    """
+    # Without a brace there is no JSON object to find (e.g. a bare refusal), so
+    # skip the parse attempts and the fence search
+    if '{' not in response_text:
+        logger.warning("%s returned no JSON object", source)
+        logger.debug("Non-JSON response text from %s:\n%s", source, response_text)
+        return None
+
+    try:
+        parsed = loads_llm_json(response_text)
+    except orjson.JSONDecodeError as e:
+        logger.warning("%s returned invalid JSON: %s", source, e)
+        logger.debug("Invalid JSON response text from %s:\n%s", source, response_text)
+        return None
+
+    if not isinstance(parsed, dict):
+        logger.warning("%s returned JSON that is not an object", source)
+        return None
+
+    return parsed
+
+
+def fill_schema_defaults(parsed: Dict[str, Any], schema: JsonSchema, source: str) -> Tuple[str, ...]:
+    """
+    Fill absent fields of a parsed object from the schema defaults, in place.
+
+    Args:
+        parsed: Parsed JSON object
+        schema: Expected fields and their defaults
+        source: Who produced the response, for logging
+
+    Returns:
+        Names of the fields that were filled in (empty when the model wrote all)
+    """
+    # Single set difference on the common all-present path
+    missing = schema.fields.difference(parsed)
+    if not missing:
+        return ()
+
+    filled = []
+    for field, default in schema.defaults.items():
+        if field in missing:
+            if field in schema.required:
+                logger.warning("%s missing required field '%s' in JSON", source, field)
+            parsed[field] = default(parsed)
+            filled.append(field)
+    return tuple(filled)
+
+
+def parse_llm_json(response_text: str, schema: JsonSchema, source: str) -> Optional[Dict[str, Any]]:
+    """
+    Parse an LLM's JSON object and fill absent fields from the schema defaults.
+
+    Args:
+        response_text: The raw response text from the model
+        schema: Expected fields and their defaults
+        source: Who produced the response, for logging (e.g. "Model openai/gpt-4o")
+
+    Returns:
+        Parsed JSON dict, or None if the response is not a JSON object
+    """
+    parsed = load_llm_object(response_text, source)
+    if parsed is not None:
+        fill_schema_defaults(parsed, schema, source)
+    return parsed
 
-    # Build optimized chairman prompt with clear structure and configurable threshold
-    chairman_prompt = f"""# Role Definition
+
+def validate_and_parse_json(response_text: str, model_name: str) -> Tuple[Dict[str, Any], Tuple[str, ...]]:
+    """
+    Validate and parse JSON response, repairing common formatting mistakes.
+
+    Args:
+        response_text: The raw response text from the model
+        model_name: Name of the model for error reporting
+
+    Returns:
+        (parsed JSON dict or empty dict if validation fails, names of the fields
+        filled from schema defaults rather than written by the model)
+    """
+    source = f"Model {model_name}"
+    parsed = load_llm_object(response_text, source)
+    if parsed is None:
+        return {}, ()
+    return parsed, fill_schema_defaults(parsed, MODEL_SCHEMA, source)
+
+
+# Static chairman instructions, formatted once with the convergence threshold
+_CHAIRMAN_PROMPT_HEADER = f"""# Role Definition
 You are the Chairman LLM (facilitator model) of a multi-agent collaboration system, responsible for guiding the discussion process and assessing convergence status.
 
 ## Language Consistency Requirement
@@ -406,13 +698,34 @@ You are the Chairman LLM (facilitator model) of a multi-agent collaboration syst
 # Content to Analyze
 
 ## User's Original Question
-{user_query}
+"""
+
+# Static comparison instructions appended to the previous-round review
+_CHAIRMAN_COMPARISON_REQUIREMENTS = """
+## This Round Comparative Analysis Requirements
+
+**When evaluating this round's discussion, you must perform the following comparative analysis:**
+
+### 1. Viewpoint Evolution Comparison
+- **Compare with previous round consensus points**: Has this round reinforced these consensus points? Have there been modifications?
+- **Compare with previous round conflict points**: Has this round resolved these conflicts? Have new conflicts emerged?
+- **New viewpoint identification**: What new viewpoints or angles have appeared in this round that were not in the previous round?
+
+### 2. Discussion Progress Assessment
+- **Question responsiveness**: Have the responses in this round effectively addressed the guiding questions proposed in the previous round?
+- **Convergence trajectory**: Is the discussion moving toward convergence or have new divergences appeared?
+- **Depth change**: Compared to the previous round, has the depth and breadth of the discussion improved?
 
-{previous_chairman_context}
+### 3. Decision Basis
+- **Stability judgment**: Is this round more stable compared to the previous round (viewpoints no longer changing significantly)?
+- **Sufficiency assessment**: Are the existing consensus points and resolved conflict points sufficient to form a high-quality answer?
+- **Remaining divergence value**: Do the remaining divergence points have a substantial impact on the quality of the final answer?
 
-## This Round's LLM Response Content
-{responses_text}
+**Special Note**: Convergence does not mean complete agreement, but rather that the discussion framework is stable, divergences are clear and manageable, and a comprehensive high-quality answer can be formed.
+"""
 
+# Closing instructions of the chairman prompt
+_CHAIRMAN_PROMPT_FOOTER = """
 ---
 
 # Start Analysis
@@ -424,143 +737,597 @@ You are the Chairman LLM (facilitator model) of a multi-agent collaboration syst
 - Final answers should objectively reflect consensus points and divergence points
 """
 
-    messages = [{"role": "user", "content": chairman_prompt}]
-
-    # Log chairman prompt for debugging
-    print(f"\n=== Chairman Prompt (Round {round_number}) ===", flush=True)
-    print(f"Prompt length: {len(chairman_prompt)} characters", flush=True)
-    print("Prompt content:", flush=True)
-    print("-" * 80, flush=True)
-    print(chairman_prompt, flush=True)
-    print("-" * 80, flush=True)
-
-    # Query the chairman model
-    response = await query_model(CHAIRMAN_MODEL, messages)
-
-    # Log chairman response for debugging
-    if response is not None:
-        response_text = response.get('content', '')
-        print(f"\n=== Chairman Response (Round {round_number}) ===", flush=True)
-        print(f"Response length: {len(response_text)} characters", flush=True)
-        print("Response content:", flush=True)
-        print("-" * 80, flush=True)
-        print(response_text, flush=True)
-        print("-" * 80, flush=True)
-    else:
-        print(f"\n=== Chairman Response (Round {round_number}) ===")
-        print("Chairman failed to respond")
-
-    if response is None:
-        # Fallback if chairman fails
-        return {
-            "convergence_score": 0.0,
-            "is_converged": False,
-            "consensus_points": [],
-            "conflict_points": [],
-            "explanation": "Chairman failed to respond",
-            "questions_for_next_round": ["Please continue the discussion"],
-            "final_integrated_conclusion": ""
-        }
 
-    response_text = response.get('content', '')
-
-    # Parse chairman's JSON response
-    try:
-        # Remove any markdown code block markers
-        cleaned_text = response_text.strip()
-        if cleaned_text.startswith('```json'):
-            cleaned_text = cleaned_text[7:]
-        if cleaned_text.startswith('```'):
-            cleaned_text = cleaned_text[3:]
-        if cleaned_text.endswith('```'):
-            cleaned_text = cleaned_text[:-3]
-
-        chairman_assessment = json.loads(cleaned_text.strip())
-
-        # Log parsed assessment for debugging
-        print(f"\n=== Parsed Chairman Assessment (Round {round_number}) ===")
-        print(f"Convergence Score: {chairman_assessment.get('convergence_score', 'N/A')}")
-        print(f"Converged: {chairman_assessment.get('is_converged', 'N/A')}")
-        print(f"Consensus Points: {chairman_assessment.get('consensus_points', [])}")
-        print(f"Conflict Points: {chairman_assessment.get('conflict_points', [])}")
-        print(f"Explanation: {chairman_assessment.get('explanation', 'N/A')}")
-        print(f"Questions for Next Round: {chairman_assessment.get('questions_for_next_round', [])}")
-        print(f"Final Conclusion: {chairman_assessment.get('final_integrated_conclusion', 'N/A')}")
-
-        # Validate required fields
-        required_fields = [
-            'convergence_score', 'is_converged', 'consensus_points',
-            'conflict_points', 'explanation', 'questions_for_next_round',
-            'final_integrated_conclusion'
-        ]
-        for field in required_fields:
-            if field not in chairman_assessment:
-                print(f"Warning: Chairman missing required field '{field}' in JSON")
-                chairman_assessment[field] = "" if field == "final_integrated_conclusion" else []
+def compact_response_text(result: Dict[str, Any]) -> str:
+    """
+    Render a model's response for embedding in a later prompt.
 
-        # Enforce convergence threshold validation
-        convergence_score = chairman_assessment.get('convergence_score', 0.0)
-        is_converged = chairman_assessment.get('is_converged', False)
+    Parsed JSON is re-serialized without indentation or markdown fences, which
+    drops whitespace-only tokens; unparseable responses are passed through.
+    Fields filled from schema defaults are left out, since the model never
+    wrote them.
 
-        # Validate convergence score is a number
-        try:
-            convergence_score = float(convergence_score)
-        except (ValueError, TypeError):
-            print(f"Warning: Chairman convergence_score '{convergence_score}' is not a number, defaulting to 0.0")
-            convergence_score = 0.0
-            chairman_assessment['convergence_score'] = 0.0
+    Args:
+        result: Round result dict with 'response', 'parsed_json' and optionally
+            'defaulted_fields'
 
-        # Enforce threshold: if score < threshold, force is_converged to False
-        if convergence_score < CONVERGENCE_THRESHOLD and is_converged:
-            print(f"Warning: Chairman set is_converged=true with score {convergence_score} < threshold {CONVERGENCE_THRESHOLD}")
-            print(f"Force: Setting is_converged=false and requiring questions for next round")
-            chairman_assessment['is_converged'] = False
+    Returns:
+        Compact response text
+    """
+    parsed_json = result.get('parsed_json')
+    if not parsed_json:
+        return result['response']
+    defaulted = result.get('defaulted_fields')
+    if defaulted:
+        parsed_json = {k: v for k, v in parsed_json.items() if k not in defaulted}
+    return orjson.dumps(parsed_json).decode()
 
-            # Ensure we have questions for next round when not converged
-            if not chairman_assessment.get('questions_for_next_round'):
-                chairman_assessment['questions_for_next_round'] = [
-                    f"Please continue discussion to reach convergence threshold of {CONVERGENCE_THRESHOLD}"
-                ]
 
-            # Clear final integrated conclusion when not converged
-            chairman_assessment['final_integrated_conclusion'] = ""
+def format_bullets(items: List[Any], empty: str, numbered: bool = False) -> str:
+    """
+    Format items as a markdown list, one per line.
 
-        return chairman_assessment
+    Args:
+        items: Items to list
+        empty: Text to use when there are no items
+        numbered: Number the items instead of using "-" bullets
 
-    except json.JSONDecodeError as e:
-        print(f"Warning: Chairman returned invalid JSON: {e}")
-        print(f"Response text: {response_text}")
-        return {
-            "convergence_score": 0.0,
-            "is_converged": False,
-            "consensus_points": [],
-            "conflict_points": [],
-            "explanation": "Invalid JSON response from chairman",
-            "questions_for_next_round": ["Please continue the discussion"],
-            "final_integrated_conclusion": ""
-        }
+    Returns:
+        Markdown list text
+    """
+    if not items:
+        return empty
+    if numbered:
+        return "\n".join(f"{i}. {item}" for i, item in enumerate(items, 1))
+    return "\n".join(f"- {item}" for item in items)
 
 
-def build_convergent_prompt(
+def build_chairman_prompt_suffix(
     user_query: str,
-    consensus_points: List[str],
-    conflict_points: List[str],
-    questions: List[str]
+    round_responses: List[Dict[str, Any]],
+    round_number: int,
+    previous_chairman_response: Optional[Dict[str, Any]] = None
 ) -> str:
     """
-    Build prompt for convergent phase based on chairman's assessment.
+    Build the per-round part of the chairman prompt that follows the static header.
 
     Args:
         user_query: The user's question
-        consensus_points: List of consensus points from chairman
-        conflict_points: List of conflict points from chairman
-        questions: List of questions for next round
+        round_responses: List of model responses for this round
+        round_number: Current round number (1 for divergent, 2+ for convergent)
+        previous_chairman_response: Previous round's chairman assessment for context
 
     Returns:
-        Formatted prompt string for convergent phase
+        Prompt text with the question, previous-round context and responses
+    """
+    # Build responses text for chairman in a single join, without an
+    # intermediate per-response string
+    parts = []
+    for result in round_responses:
+        parts.extend((result['model'], ":\n", compact_response_text(result), "\n\n"))
+    responses_text = "".join(parts[:-1])
+
+    # Build previous chairman context section if available
+    previous_chairman_context = ""
+    if previous_chairman_response and round_number > 1:
+        # Format the detailed previous round context for better comparison
+        prev_consensus = previous_chairman_response.get('consensus_points', [])
+        prev_conflicts = previous_chairman_response.get('conflict_points', [])
+        prev_questions = previous_chairman_response.get('questions_for_next_round', [])
+        prev_score = previous_chairman_response.get('convergence_score', 'N/A')
+        prev_converged = previous_chairman_response.get('is_converged', 'N/A')
+        prev_explanation = previous_chairman_response.get('explanation', 'N/A')
+
+        previous_chairman_context = f"""
+
+## Previous Round Discussion Status Review (Round {round_number-1})
+
+### Previous Round Key Metrics
+- **Convergence Score**: {prev_score}/1.0
+- **Convergence Status**: {prev_converged}
+
+### Previous Round Identified Consensus Points
+{format_bullets(prev_consensus, "- No clear consensus points")}
+
+### Previous Round Identified Main Conflict Points
+{format_bullets(prev_conflicts, "- No significant conflict points")}
+
+### Previous Round Proposed Guiding Questions
+{format_bullets(prev_questions, "- No specific guiding questions", numbered=True)}
+
+### Previous Round Convergence Analysis
+{prev_explanation}
+{_CHAIRMAN_COMPARISON_REQUIREMENTS}"""
+
+    return "".join([
+        user_query,
+        "\n\n",
+        previous_chairman_context,
+        "\n\n## This Round's LLM Response Content\n",
+        responses_text,
+        "\n",
+        _CHAIRMAN_PROMPT_FOOTER
+    ])
+
+
+def build_chairman_prompt(
+    user_query: str,
+    round_responses: List[Dict[str, Any]],
+    round_number: int,
+    previous_chairman_response: Optional[Dict[str, Any]] = None
+) -> str:
+    """
+    Build the chairman's convergence assessment prompt.
+
+    Args:
+        user_query: The user's question
+        round_responses: List of model responses for this round
+        round_number: Current round number (1 for divergent, 2+ for convergent)
+        previous_chairman_response: Previous round's chairman assessment for context
+
+    Returns:
+        Formatted chairman prompt string
+    """
+    return _CHAIRMAN_PROMPT_HEADER + build_chairman_prompt_suffix(
+        user_query, round_responses, round_number, previous_chairman_response
+    )
+
+
+def build_chairman_messages(
+    user_query: str,
+    round_responses: List[Dict[str, Any]],
+    round_number: int,
+    previous_chairman_response: Optional[Dict[str, Any]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Build the chairman messages with the static header marked as cacheable.
+
+    Args:
+        user_query: The user's question
+        round_responses: List of model responses for this round
+        round_number: Current round number (1 for divergent, 2+ for convergent)
+        previous_chairman_response: Previous round's chairman assessment for context
+
+    Returns:
+        Message list to send to the chairman
+    """
+    return [build_cached_user_message(
+        _CHAIRMAN_PROMPT_HEADER,
+        build_chairman_prompt_suffix(
+            user_query, round_responses, round_number, previous_chairman_response
+        )
+    )]
+
+
+def extract_completed_fields(
+    buffer: str,
+    fields: List[str],
+    found: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Extract top-level JSON fields whose values have fully streamed into a buffer.
+
+    Args:
+        buffer: Accumulated (possibly incomplete) JSON response text
+        fields: Field names to look for
+        found: Fields already extracted, which are skipped
+
+    Returns:
+        Dict of newly completed field values
+    """
+    completed = {}
+
+    for field in fields:
+        if field in found:
+            continue
+
+        key_index = buffer.find(f'"{field}"')
+        if key_index == -1:
+            continue
+
+        colon_index = buffer.find(':', key_index + len(field) + 2)
+        if colon_index == -1:
+            continue
+
+        value_start = colon_index + 1
+        while value_start < len(buffer) and buffer[value_start].isspace():
+            value_start += 1
+
+        try:
+            value, value_end = _STREAM_DECODER.raw_decode(buffer, value_start)
+        except ValueError:
+            # Value has not fully arrived yet
+            continue
+
+        # A number or literal is complete only once a delimiter follows it: at
+        # a chunk boundary "0." decodes as 0 while the model is writing 0.9
+        if not isinstance(value, (str, list, dict)) and (
+            value_end >= len(buffer) or buffer[value_end] not in _VALUE_DELIMITERS
+        ):
+            continue
+
+        completed[field] = value
+
+    return completed
+
+
+def candidate_similarity(a: frozenset, b: frozenset) -> float:
+    """
+    Jaccard similarity between two word sets.
+
+    Args:
+        a: Words of the first candidate
+        b: Words of the second candidate
+
+    Returns:
+        Similarity in [0, 1]
+    """
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+def response_fingerprint(round_responses: List[Dict[str, Any]]) -> bytes:
+    """
+    Order-independent digest of a round's responses.
+
+    Parsed JSON is compared with sorted keys; responses that failed to parse
+    contribute their raw text.
+
+    Args:
+        round_responses: List of model responses for this round
+
+    Returns:
+        Digest that is equal for rounds with identical content
+    """
+    normalized = sorted(
+        (result["model"], result.get("parsed_json") or result.get("response") or "")
+        for result in round_responses
+    )
+    return hashlib.blake2b(
+        orjson.dumps(normalized, option=orjson.OPT_SORT_KEYS), digest_size=16
+    ).digest()
+
+
+def agreed_candidate(round_responses: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Find a final answer candidate the council agrees on.
+
+    Candidates are compared by word-set similarity. The council agrees when every
+    member answered and all pairs reach CANDIDATE_UNANIMOUS_THRESHOLD, or when at
+    least 3/4 of the council are within CANDIDATE_AGREEMENT_THRESHOLD of one
+    candidate. Anything less goes to the chairman.
+
+    Args:
+        round_responses: List of model responses for this round
+
+    Returns:
+        Dict with 'model', 'candidate' and 'score' for the longest candidate of the
+        agreeing group, or None if there is no sufficient agreement
+    """
+    candidates = []
+    for result in round_responses:
+        candidate = (result.get('parsed_json') or {}).get('final_answer_candidate')
+        if isinstance(candidate, str) and candidate.strip():
+            words = frozenset(_WORD_RE.findall(candidate.lower()))
+            candidates.append((result['model'], candidate, words))
+
+    total_models = len(COUNCIL_MODELS)
+    quorum = -(-3 * total_models // 4)  # ceil(3/4 of the council)
+    if len(candidates) < max(quorum, 2):
+        return None
+
+    # Similarity of every pair, computed once
+    similarity = {}
+    for (i, (_, _, a)), (j, (_, _, b)) in combinations(enumerate(candidates), 2):
+        similarity[i, j] = similarity[j, i] = candidate_similarity(a, b)
+
+    if len(candidates) == total_models:
+        lowest = min(similarity.values())
+        if lowest >= CANDIDATE_UNANIMOUS_THRESHOLD:
+            model, candidate, _ = max(candidates, key=lambda item: len(item[1]))
+            return {"model": model, "candidate": candidate, "score": lowest}
+
+    for i in range(len(candidates)):
+        group = [i] + [
+            j for j in range(len(candidates))
+            if j != i and similarity[i, j] >= CANDIDATE_AGREEMENT_THRESHOLD
+        ]
+        if len(group) >= quorum:
+            best = max(group, key=lambda k: len(candidates[k][1]))
+            return {
+                "model": candidates[best][0],
+                "candidate": candidates[best][1],
+                "score": min((similarity[i, j] for j in group if j != i), default=1.0)
+            }
+
+    return None
+
+
+def build_agreement_assessment(agreement: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Build a converged assessment from agreeing council candidates.
+
+    Args:
+        agreement: Result of agreed_candidate
+
+    Returns:
+        Chairman-shaped assessment dict with the agreed answer as conclusion
+    """
+    return {
+        "convergence_score": max(agreement["score"], CONVERGENCE_THRESHOLD),
+        "is_converged": True,
+        "consensus_points": [],
+        "conflict_points": [],
+        "explanation": (
+            f"Council members gave near-identical final answers (similarity "
+            f"{agreement['score']:.2f}); chairman assessment was skipped."
+        ),
+        "questions_for_next_round": [],
+        "final_integrated_conclusion": agreement["candidate"],
+        "conclusion_model": agreement["model"]
+    }
+
+
+async def evaluate_convergence_stream(
+    user_query: str,
+    round_responses: List[Dict[str, Any]],
+    round_number: int,
+    previous_chairman_response: Optional[Dict[str, Any]] = None
+):
+    """
+    Evaluate convergence while streaming the chairman's response.
+
+    Args:
+        user_query: The user's question
+        round_responses: List of model responses for this round
+        round_number: Current round number (1 for divergent, 2+ for convergent)
+        previous_chairman_response: Previous round's chairman assessment for context
+
+    Yields:
+        'chairman_partial' events as each early field of the assessment completes,
+        followed by one 'chairman_assessment' event with the validated assessment
+    """
+    # Skip the chairman call entirely when the council already agrees
+    agreement = agreed_candidate(round_responses)
+    if agreement is not None:
+        logger.info(
+            "Round %d: council candidates agree (similarity %.2f), skipping chairman",
+            round_number, agreement["score"]
+        )
+        assessment = build_agreement_assessment(agreement)
+        for field in CHAIRMAN_EARLY_FIELDS:
+            yield {
+                "type": "chairman_partial",
+                "data": {"round": round_number, "field": field, "value": assessment[field]}
+            }
+        yield {"type": "chairman_assessment", "data": assessment}
+        return
+
+    messages = build_chairman_messages(
+        user_query, round_responses, round_number, previous_chairman_response
+    )
+
+    # Log chairman prompt for debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        chairman_prompt = messages_text(messages)
+        logger.debug(
+            "Chairman prompt (round %d, %d characters):\n%s",
+            round_number, len(chairman_prompt), chairman_prompt
+        )
+
+    # Stream the chairman model, surfacing fields as soon as they are complete;
+    # fall back to the next chairman only if one fails without any output
+    response_text = ""
+    partial_fields = {}
+    for chairman_model in (CHAIRMAN_MODEL, *CHAIRMAN_FALLBACK_MODELS):
+        async for delta in query_model_stream(chairman_model, messages):
+            response_text += delta
+
+            completed = extract_completed_fields(response_text, CHAIRMAN_EARLY_FIELDS, partial_fields)
+            for field, value in completed.items():
+                # Apply the convergence threshold to the early verdict as well
+                if field == 'is_converged' and value is True:
+                    score = partial_fields.get('convergence_score')
+                    if isinstance(score, (int, float)) and score < CONVERGENCE_THRESHOLD:
+                        value = False
+
+                partial_fields[field] = value
+                yield {
+                    "type": "chairman_partial",
+                    "data": {"round": round_number, "field": field, "value": value}
+                }
+
+        if response_text:
+            break
+        logger.warning("Chairman %s failed to respond in round %d", chairman_model, round_number)
+
+    assessment = parse_chairman_response(response_text or None, round_number)
+    if response_text:
+        assessment["conclusion_model"] = chairman_model
+
+    yield {"type": "chairman_assessment", "data": assessment}
+
+
+async def pump_events(stream: AsyncIterator[Dict[str, Any]], queue: asyncio.Queue) -> None:
+    """
+    Forward an event stream into a queue (used to run the chairman as a background
+    task whose events are consumed live). None marks the end of the stream.
+
+    Args:
+        stream: Async iterator of events
+        queue: Queue receiving the events
+    """
+    try:
+        async for event in stream:
+            queue.put_nowait(event)
+    finally:
+        queue.put_nowait(None)
+
+
+async def drain_events(queue: asyncio.Queue, task: asyncio.Task) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield events from a queue filled by pump_events() as they arrive.
+
+    Args:
+        queue: Queue filled by pump_events()
+        task: The task running pump_events(), awaited at the end to surface errors
+
+    Yields:
+        The events in order
+    """
+    while True:
+        event = await queue.get()
+        if event is None:
+            break
+        yield event
+    await task
+
+
+async def evaluate_convergence(
+    user_query: str,
+    round_responses: List[Dict[str, Any]],
+    round_number: int,
+    previous_chairman_response: Optional[Dict[str, Any]] = None
+) -> Dict[str, Any]:
+    """
+    Evaluate convergence and generate chairman's assessment.
+
+    Args:
+        user_query: The user's question
+        round_responses: List of model responses for this round
+        round_number: Current round number (1 for divergent, 2+ for convergent)
+        previous_chairman_response: Previous round's chairman assessment for context
+
+    Returns:
+        Chairman's assessment in JSON format
     """
-    # Optimized convergent phase prompt with enhanced consensus/conflict analysis
-    system_prompt = """# Role and Task
+    chairman_assessment = None
+    async for event in evaluate_convergence_stream(
+        user_query, round_responses, round_number, previous_chairman_response
+    ):
+        if event["type"] == "chairman_assessment":
+            chairman_assessment = event["data"]
+
+    return chairman_assessment
+
+
+# Assessment used when the chairman's output is unusable; the round continues
+CHAIRMAN_FALLBACK = {
+    "convergence_score": 0.0,
+    "is_converged": False,
+    "consensus_points": [],
+    "conflict_points": [],
+    "explanation": "",
+    "questions_for_next_round": ["Please continue the discussion"],
+    "final_integrated_conclusion": ""
+}
+
+
+def chairman_fallback(reason: str) -> Dict[str, Any]:
+    """
+    Build a not-converged assessment for when the chairman's output is unusable.
+
+    Args:
+        reason: Explanation recorded in the assessment
+
+    Returns:
+        Fresh copy of the fallback assessment (lists are copied, so callers may mutate it)
+    """
+    fallback = {
+        field: list(value) if isinstance(value, list) else value
+        for field, value in CHAIRMAN_FALLBACK.items()
+    }
+    fallback["explanation"] = reason
+    return fallback
+
+
+def parse_chairman_response(response_text: Optional[str], round_number: int) -> Dict[str, Any]:
+    """
+    Parse, validate and threshold-check the chairman's raw response.
+
+    Args:
+        response_text: The chairman's raw response text, or None if it failed
+        round_number: Current round number (for logging)
+
+    Returns:
+        Chairman's assessment in JSON format
+    """
+    # Log chairman response for debugging
+    if response_text is not None:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Chairman response (round %d, %d characters):\n%s",
+                round_number, len(response_text), response_text
+            )
+    else:
+        logger.warning("Chairman failed to respond in round %d", round_number)
+
+    if response_text is None:
+        # Fallback if chairman fails
+        return chairman_fallback("Chairman failed to respond")
+
+    # Parse chairman's JSON response
+    chairman_assessment = parse_llm_json(response_text, CHAIRMAN_SCHEMA, "Chairman")
+    if chairman_assessment is None:
+        return chairman_fallback("Invalid JSON response from chairman")
+
+    # List fields may come back as a single string or null
+    for field in CHAIRMAN_GUIDANCE_FIELDS:
+        chairman_assessment[field] = list(guidance_items(chairman_assessment[field]))
+
+    # Log parsed assessment for debugging
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Parsed chairman assessment (round %d): score=%s converged=%s "
+            "consensus=%s conflicts=%s explanation=%s questions=%s conclusion=%s",
+            round_number,
+            chairman_assessment['convergence_score'],
+            chairman_assessment['is_converged'],
+            chairman_assessment['consensus_points'],
+            chairman_assessment['conflict_points'],
+            chairman_assessment['explanation'],
+            chairman_assessment['questions_for_next_round'],
+            chairman_assessment['final_integrated_conclusion'],
+        )
+
+    # Enforce convergence threshold validation
+    convergence_score = chairman_assessment['convergence_score']
+    is_converged = chairman_assessment['is_converged']
+
+    # Validate convergence score is a number (JSON numbers need no conversion;
+    # numeric strings such as "0.9" are still accepted)
+    if not isinstance(convergence_score, (int, float)):
+        try:
+            convergence_score = float(convergence_score)
+        except (ValueError, TypeError):
+            logger.warning("Chairman convergence_score '%s' is not a number, defaulting to 0.0", convergence_score)
+            convergence_score = 0.0
+            chairman_assessment['convergence_score'] = 0.0
+
+    # Enforce threshold: if score < threshold, force is_converged to False
+    if convergence_score < CONVERGENCE_THRESHOLD and is_converged:
+        logger.warning(
+            "Chairman set is_converged=true with score %s < threshold %s; "
+            "forcing is_converged=false and requiring questions for next round",
+            convergence_score, CONVERGENCE_THRESHOLD
+        )
+        chairman_assessment['is_converged'] = False
+
+        # Ensure we have questions for next round when not converged
+        if not chairman_assessment.get('questions_for_next_round'):
+            chairman_assessment['questions_for_next_round'] = [
+                f"Please continue discussion to reach convergence threshold of {CONVERGENCE_THRESHOLD}"
+            ]
+
+        # Clear final integrated conclusion when not converged
+        chairman_assessment['final_integrated_conclusion'] = ""
+
+    return chairman_assessment
+
+
+# Static convergent phase instructions, up to the list of consensus points
+_CONVERGENT_PROMPT_HEADER = """# Role and Task
 
 ## Role Definition
 You are an AI model in a multi-agent collaboration system, participating in the convergent phase discussion. Your task is not only to answer questions but also to deeply analyze the previous round's discussion results.
@@ -574,7 +1341,7 @@ You are an AI model in a multi-agent collaboration system, participating in the
 
 ## Core Tasks
 
-### 🔍 Deep Analysis of Previous Round Discussion Results
+### Deep Analysis of Previous Round Discussion Results
 
 #### 1. Deep Analysis of Consensus Points
 **For each consensus point, you must think and answer:**
@@ -590,15 +1357,11 @@ You are an AI model in a multi-agent collaboration system, participating in the
 - **Root Cause**: What is the fundamental cause of this conflict point? Is it value differences, factual disputes, or methodological disagreements?
 - **Impact Assessment**: How much substantive impact does this conflict point have on the final answer? Is it a key divergence?
 
-### 🎯 Answer Chairman Questions
+### Answer Chairman Questions
 - Answer the questions raised by this round's Chairman based on the above deep analysis
 - Organically integrate your analysis conclusions with question answers
 - Promote discussion toward convergence
 
-### 📋 Structured Output
-- Use structured JSON format to output your analysis results
-- Ensure analysis depth and logical clarity
-
 ---
 
 # Output Format
@@ -647,38 +1410,157 @@ You are an AI model in a multi-agent collaboration system, participating in the
 
 # Discussion Context
 
-## 📊 Previous Round Chairman Assessment Results
+## Previous Round Chairman Assessment Results
 
-### 🎯 Identified Consensus Points (requiring deep analysis)
+### Identified Consensus Points (requiring deep analysis)
+**Please conduct deep analysis for each of the following consensus points (must include: agreement level, supplementary explanation, limiting conditions, deeper understanding):**
 """
 
-    # Add consensus points with analysis guidance
-    system_prompt += "**Please conduct deep analysis for each of the following consensus points (must include: agreement level, supplementary explanation, limiting conditions, deeper understanding):**\n"
-    for i, point in enumerate(consensus_points, 1):
-        system_prompt += f"{i}. **{point}**\n   - *Your analysis requirements: agreement level? supplementary evidence? established conditions? deeper understanding?*\n"
+# Fixed headings between the variable sections of the convergent phase prompt
+_CONVERGENT_PROMPT_CONFLICTS = (
+    "\n### Identified Conflict Points (requiring deep analysis)\n"
+    "**Please conduct deep analysis for each of the following conflict points (must include: position choice, reconciliation approach, root cause, impact assessment):**\n"
+)
+_CONVERGENT_PROMPT_QUESTION = "\n---\n\n# This Round's Core Tasks\n\n## User's Original Question\n"
+_CONVERGENT_PROMPT_QUESTIONS = "## Questions That Must Be Answered This Round\n"
+
+# Closing instructions of the convergent phase prompt
+_CONVERGENT_PROMPT_FOOTER = (
+    "\n## Integration Requirements\n"
+    "**Your answers must demonstrate the following integration capabilities:**\n"
+    "1. **Analysis Integration**: Organically integrate your deep analysis of consensus points and conflict points with question answers\n"
+    "2. **Evolution Perspective**: Explain how your analysis helps discussion move from divergence to consensus\n"
+    "3. **Solution Approach**: Propose specific reconciliation or solution approaches for conflict points\n"
+    "4. **Convergence Orientation**: How your viewpoints promote the convergence of the entire discussion\n"
+    "\n---\n\n# Start Answering\n**Please output your viewpoints according to the specified JSON format, strictly based on the above deep analysis requirements.**"
+)
+
+
+@lru_cache(maxsize=16)
+def build_convergent_prompt_suffix(
+    user_query: str,
+    consensus_points: Tuple[str, ...],
+    conflict_points: Tuple[str, ...],
+    questions: Tuple[str, ...]
+) -> str:
+    """
+    Build the per-round part of the convergent prompt that follows the static header.
+
+    Memoized on the (tuple) guidance: a speculative next round and the round that
+    reuses it ask for the same prompt, so the second build is a cache hit.
+
+    Args:
+        user_query: The user's question
+        consensus_points: Consensus points from chairman
+        conflict_points: Conflict points from chairman
+        questions: Questions for next round
+
+    Returns:
+        Prompt text with the chairman's guidance and the user's question
+    """
+    # Add consensus points, conflict points and questions with analysis guidance
+    consensus_block = "".join(
+        f"{i}. **{point}**\n   - *Your analysis requirements: agreement level? supplementary evidence? established conditions? deeper understanding?*\n"
+        for i, point in enumerate(consensus_points, 1)
+    )
+    conflict_block = "".join(
+        f"{i}. **{point}**\n   - *Your analysis requirements: your position? resolution suggestions? root cause? impact degree?*\n"
+        for i, point in enumerate(conflict_points, 1)
+    )
+    questions_block = "".join(
+        f"{i}. **{question}**\n   - *Answer requirements: Please answer this question combining the above deep analysis of consensus points and conflict points*\n"
+        for i, question in enumerate(questions, 1)
+    )
+
+    return (
+        f"{consensus_block}"
+        f"{_CONVERGENT_PROMPT_CONFLICTS}{conflict_block}"
+        f"{_CONVERGENT_PROMPT_QUESTION}{user_query}\n\n"
+        f"{_CONVERGENT_PROMPT_QUESTIONS}{questions_block}"
+        f"{_CONVERGENT_PROMPT_FOOTER}"
+    )
+
 
-    system_prompt += "\n### ⚡ Identified Conflict Points (requiring deep analysis)\n"
-    system_prompt += "**Please conduct deep analysis for each of the following conflict points (must include: position choice, reconciliation approach, root cause, impact assessment):**\n"
-    for i, point in enumerate(conflict_points, 1):
-        system_prompt += f"{i}. **{point}**\n   - *Your analysis requirements: your position? resolution suggestions? root cause? impact degree?*\n"
+def build_convergent_prompt(
+    user_query: str,
+    consensus_points: List[str],
+    conflict_points: List[str],
+    questions: List[str]
+) -> str:
+    """
+    Build prompt for convergent phase based on chairman's assessment.
+
+    Args:
+        user_query: The user's question
+        consensus_points: List of consensus points from chairman
+        conflict_points: List of conflict points from chairman
+        questions: List of questions for next round
 
-    system_prompt += "\n---\n\n# 🎯 This Round's Core Tasks\n\n## 📋 User's Original Question\n"
-    system_prompt += f"{user_query}\n\n"
+    Returns:
+        Formatted prompt string for convergent phase
+    """
+    return _CONVERGENT_PROMPT_HEADER + build_convergent_prompt_suffix(
+        user_query, *guidance_tuples(consensus_points, conflict_points, questions)
+    )
+
+
+def build_convergent_messages(
+    user_query: str,
+    consensus_points: List[str],
+    conflict_points: List[str],
+    questions: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Build the convergent phase messages with the static header marked as cacheable.
+
+    Args:
+        user_query: The user's question
+        consensus_points: List of consensus points from chairman
+        conflict_points: List of conflict points from chairman
+        questions: List of questions for next round
+
+    Returns:
+        Message list to send to each council model
+    """
+    return [build_cached_user_message(
+        _CONVERGENT_PROMPT_HEADER,
+        build_convergent_prompt_suffix(
+            user_query, *guidance_tuples(consensus_points, conflict_points, questions)
+        )
+    )]
+
+
+def guidance_tuples(*lists: List[Any]) -> Tuple[Tuple[str, ...], ...]:
+    """
+    Convert guidance lists to string tuples (hashable, rendered identically).
+
+    Args:
+        *lists: Consensus points, conflict points and questions
+
+    Returns:
+        Tuple of string tuples in the same order
+    """
+    return tuple(
+        value if isinstance(value, tuple) else tuple(str(item) for item in value)
+        for value in lists
+    )
 
-    system_prompt += "## ❓ Questions That Must Be Answered This Round\n"
-    for i, question in enumerate(questions, 1):
-        system_prompt += f"{i}. **{question}**\n   - *Answer requirements: Please answer this question combining the above deep analysis of consensus points and conflict points*\n"
 
-    system_prompt += "\n## 🔗 Integration Requirements\n"
-    system_prompt += "**Your answers must demonstrate the following integration capabilities:**\n"
-    system_prompt += "1. **Analysis Integration**: Organically integrate your deep analysis of consensus points and conflict points with question answers\n"
-    system_prompt += "2. **Evolution Perspective**: Explain how your analysis helps discussion move from divergence to consensus\n"
-    system_prompt += "3. **Solution Approach**: Propose specific reconciliation or solution approaches for conflict points\n"
-    system_prompt += "4. **Convergence Orientation**: How your viewpoints promote the convergence of the entire discussion\n"
+def messages_text(messages: List[Dict[str, Any]]) -> str:
+    """
+    Flatten messages (string or content-part content) into plain text for logging.
 
-    system_prompt += "\n---\n\n# 🚀 Start Answering\n**Please output your viewpoints according to the specified JSON format, strictly based on the above deep analysis requirements. Your analysis depth will directly affect the convergence quality of the discussion.**"
+    Args:
+        messages: Message list as sent to OpenRouter
 
-    return system_prompt
+    Returns:
+        Concatenated message text
+    """
+    return "".join(
+        message["content"] if isinstance(message["content"], str)
+        else "".join(part["text"] for part in message["content"])
+        for message in messages
+    )
 
 
 async def run_convergent_phase(
@@ -702,38 +1584,31 @@ async def run_convergent_phase(
     convergent_results = []
 
     # Build convergent prompt
-    prompt = build_convergent_prompt(user_query, consensus_points, conflict_points, questions)
-    messages = [{"role": "user", "content": prompt}]
+    messages = build_convergent_messages(user_query, consensus_points, conflict_points, questions)
 
     # Log convergent phase prompt for debugging
-    print(f"\n=== Convergent Phase Prompt ===")
-    print(f"Prompt length: {len(prompt)} characters")
-    print("Prompt content:")
-    print("-" * 80)
-    print(prompt)
-    print("-" * 80)
-
-    # Query all models in parallel
-    responses = await query_models_parallel(COUNCIL_MODELS, messages)
-
-    # Format results
-    for model, response in responses.items():
+    if logger.isEnabledFor(logging.DEBUG):
+        prompt = messages_text(messages)
+        logger.debug("Convergent phase prompt (%d characters):\n%s", len(prompt), prompt)
+
+    # Query all models in parallel and process each response as soon as it arrives
+    async for model, response in query_models_as_completed(COUNCIL_MODELS, messages, ROUND_DEADLINE):
         if response is not None:
-            response_text = response.get('content', '')
-            parsed_json = validate_and_parse_json(response_text, model)
+            response_text = response.get('content') or ''
+            parsed_json, defaulted_fields = validate_and_parse_json(response_text, model)
 
             # Log convergent phase response for debugging
-            print(f"\n=== Convergent Phase - Response from {model} ===")
-            print(f"Response length: {len(response_text)} characters")
-            print("Response content:")
-            print("-" * 80)
-            print(response_text)
-            print("-" * 80)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Convergent response from %s (%d characters):\n%s",
+                    model, len(response_text), response_text
+                )
 
             convergent_results.append({
                 "model": model,
                 "response": response_text,
-                "parsed_json": parsed_json
+                "parsed_json": parsed_json,
+                "defaulted_fields": defaulted_fields
             })
 
     return convergent_results
@@ -741,376 +1616,641 @@ async def run_convergent_phase(
 
 
 
-async def run_full_council_stream(user_query: str):
+def chairman_guidance(chairman_assessment: Dict[str, Any]) -> Optional[tuple]:
     """
-    Run the complete multi-round council process with streaming output.
+    Extract the inputs for the next convergent round from a chairman assessment.
 
     Args:
-        user_query: The user's question
+        chairman_assessment: Full or partially streamed chairman assessment
 
-    Yields:
-        Dict events for each stage of completion
+    Returns:
+        (consensus_points, conflict_points, questions) tuple of string tuples, or None
+        if any is missing
     """
-    # IMMEDIATE YIELD to avoid timeout - let frontend know we're starting
-    yield {
-        "type": "initializing",
-        "data": {
-            "message": "Initializing multi-round council process...",
-            "user_query": user_query
-        }
-    }
+    if not all(field in chairman_assessment for field in CHAIRMAN_GUIDANCE_FIELDS):
+        return None
+    # Hashable (and rendered identically in the prompt) so prompts can be cached
+    return tuple(
+        guidance_items(chairman_assessment[field]) for field in CHAIRMAN_GUIDANCE_FIELDS
+    )
 
-    all_rounds_results = []
-    max_rounds = 5  # Maximum rounds including divergent phase
-    previous_chairman_assessment = None  # Track previous chairman response
 
-    # Round 1: Divergent Phase
-    print(f"\n=== Round 1: Divergent Phase ===")
+def guidance_items(value: Any) -> Tuple[str, ...]:
+    """
+    Normalize a chairman guidance field to a tuple of strings.
 
-    # Yield round start event
-    yield {
-        "type": "round_start",
-        "data": {
-            "round": 1,
-            "type": "divergent",
-            "message": "Starting divergent phase - gathering initial perspectives..."
-        }
-    }
+    Models sometimes return a single string or null instead of a list.
 
-    # Build prompt for all models (no accumulated context)
-    prompt = build_divergent_prompt(user_query)
-    messages = [{"role": "user", "content": prompt}]
+    Args:
+        value: Raw field value from the chairman's JSON
 
-    # Enhanced debugging for streaming divergent phase
-    print(f"\n{'='*100}", flush=True)
-    print(f"🚀 STREAMING - Round 1 Divergent Phase - Parallel Query", flush=True)
-    print(f"📝 Prompt length: {len(prompt)} characters", flush=True)
-    print(f"📤 Sending prompt to all {len(COUNCIL_MODELS)} models in parallel...", flush=True)
-    print("─" * 80, flush=True)
-    print(prompt, flush=True)
-    print("─" * 80, flush=True)
+    Returns:
+        Tuple of non-empty item strings
+    """
+    if value is None:
+        return ()
+    if isinstance(value, (list, tuple)):
+        return tuple(str(item) for item in value if item is not None)
+    text = str(value).strip()
+    return (text,) if text else ()
 
-    # Query all models in parallel
-    responses = await query_models_parallel(COUNCIL_MODELS, messages)
 
-    # Process and stream individual results
-    divergent_results = []
-    completed_models = 0
+# Council responses that parsed successfully, by digest of (model, request
+# messages): (expiry, response text), oldest first. Empty unless RESPONSE_CACHE_SIZE > 0
+_RESPONSE_CACHE: "OrderedDict[bytes, Tuple[float, str]]" = OrderedDict()
 
-    for i, (model, response) in enumerate(responses.items()):
-        if response is not None:
-            response_text = response.get('content', '')
-            parsed_json = validate_and_parse_json(response_text, model)
-
-            # Enhanced debugging for response
-            print(f"📥 Parallel response {i+1}/{len(responses)} from {model}", flush=True)
-            print(f"📊 Response length: {len(response_text)} characters", flush=True)
-            print("─" * 80, flush=True)
-            print(response_text, flush=True)
-            print("─" * 80, flush=True)
-
-            if parsed_json:
-                print(f"✅ JSON parsing successful for {model}", flush=True)
-                print(f"📋 Parsed structure: {list(parsed_json.keys())}", flush=True)
-            else:
-                print(f"⚠️  JSON parsing failed for {model}", flush=True)
 
-            result = {
-                "model": model,
-                "response": response_text,
-                "parsed_json": parsed_json
-            }
+def response_cache_key(model: str, encoded_messages: bytes) -> bytes:
+    """
+    Digest identifying a model request.
 
-            divergent_results.append(result)
-            completed_models += 1
+    Args:
+        model: OpenRouter model identifier
+        encoded_messages: Request messages from encode_messages()
 
-            # Yield individual model response
-            yield {
-                "type": "model_response_complete",
-                "data": {
-                    "round": 1,
-                    "model": model,
-                    "response": response_text,
-                    "parsed_json": parsed_json,
-                    "completed_models": completed_models,
-                    "total_models": len(COUNCIL_MODELS)
-                }
-            }
+    Returns:
+        Cache key
+    """
+    digest = hashlib.blake2b(model.encode(), digest_size=16)
+    digest.update(b"\0")
+    digest.update(encoded_messages)
+    return digest.digest()
 
-            print(f"✅ Model {model} response completed and yielded", flush=True)
-        else:
-            print(f"❌ Model {model} failed to respond", flush=True)
 
-    # If no models responded successfully, send error
-    if not divergent_results:
-        yield {
-            "type": "error",
-            "message": "All models failed to respond. Please try again."
-        }
+def cache_response(model: str, encoded_messages: bytes, response_text: str) -> None:
+    """
+    Remember a council response that parsed successfully.
+
+    Args:
+        model: OpenRouter model identifier
+        encoded_messages: Request messages from encode_messages()
+        response_text: The model's raw response text
+    """
+    if RESPONSE_CACHE_SIZE <= 0:
         return
+    cache_key = response_cache_key(model, encoded_messages)
+    _RESPONSE_CACHE[cache_key] = (time.monotonic() + RESPONSE_CACHE_TTL, response_text)
+    _RESPONSE_CACHE.move_to_end(cache_key)
+    if len(_RESPONSE_CACHE) > RESPONSE_CACHE_SIZE:
+        _RESPONSE_CACHE.popitem(last=False)
 
-    # Add round to results
-    round_data = {
-        "round": 1,
-        "type": "divergent",
-        "responses": divergent_results
-    }
-    all_rounds_results.append(round_data)
-
-    # Enhanced debugging for chairman evaluation after divergent phase
-    print(f"\n{'='*100}", flush=True)
-    print(f"🔍 STREAMING - Round 1 Divergent Phase Complete - Chairman Evaluation", flush=True)
-    print(f"📊 Total divergent responses: {len(divergent_results)}", flush=True)
-    print(f"📤 Sending divergent responses to chairman: {CHAIRMAN_MODEL}", flush=True)
-    print("─" * 80, flush=True)
-
-    # Evaluate convergence after divergent phase
-    chairman_assessment = await evaluate_convergence(user_query, divergent_results, 1, previous_chairman_assessment)
-
-    # Add chairman assessment to results
-    round_data["chairman_assessment"] = chairman_assessment
-
-    # Enhanced debugging for chairman assessment
-    convergence_score = chairman_assessment.get("convergence_score", 0.0)
-    is_converged = chairman_assessment.get("is_converged", False)
-    print(f"📋 Chairman assessment complete:", flush=True)
-    print(f"   🎯 Convergence Score: {convergence_score}/1.0", flush=True)
-    print(f"   ✅ Is Converged: {is_converged}", flush=True)
-    print(f"   💭 Consensus Points: {len(chairman_assessment.get('consensus_points', []))}", flush=True)
-    print(f"   ⚡ Conflict Points: {len(chairman_assessment.get('conflict_points', []))}", flush=True)
-    print("─" * 80, flush=True)
-
-    # Yield round complete event
-    yield {
-        "type": "round_complete",
-        "data": {
-            "round": 1,
-            "type": "divergent",
-            "responses": divergent_results,
-            "chairman_assessment": chairman_assessment,
-            "is_converged": chairman_assessment.get("is_converged", False),
-            "convergence_score": chairman_assessment.get("convergence_score", 0.0)
+
+def start_council_queries(
+    encoded_messages: bytes
+) -> List["asyncio.Task[Tuple[str, Optional[Dict[str, Any]]]]"]:
+    """
+    Start querying the council, answering from the response cache where possible.
+
+    Args:
+        encoded_messages: Request messages from encode_messages()
+
+    Returns:
+        List of tasks, each resolving to a (model, response) tuple; cache hits
+        have 'cached' set in the response
+    """
+    if RESPONSE_CACHE_SIZE <= 0:
+        return start_model_queries(COUNCIL_MODELS, encoded_messages)
+
+    async def _cached(model: str, response_text: str):
+        return model, {'content': response_text, 'reasoning_details': None, 'cached': True}
+
+    tasks = []
+    uncached_models = []
+    now = time.monotonic()
+    for model in COUNCIL_MODELS:
+        cache_key = response_cache_key(model, encoded_messages)
+        cached = _RESPONSE_CACHE.get(cache_key)
+        if cached is not None and cached[0] > now:
+            _RESPONSE_CACHE.move_to_end(cache_key)
+            logger.debug("Reusing cached response from model %s", model)
+            tasks.append(asyncio.create_task(_cached(model, cached[1])))
+        else:
+            _RESPONSE_CACHE.pop(cache_key, None)
+            uncached_models.append(model)
+
+    return tasks + start_model_queries(uncached_models, encoded_messages)
+
+
+# Static instructions for the final answer of a discussion that did not converge
+_FINAL_SYNTHESIS_PROMPT_PREFIX = """# Role Definition
+You are the Chairman LLM of a multi-agent collaboration system. The discussion has ended without full convergence, and the user still needs an answer.
+
+# Task
+- Write the best final answer to the user's question, integrating the council's final positions below
+- Where the council still disagrees, present the main alternatives and say which is best supported and why
+- Respond in the same language as the user's question
+- Output the answer itself as plain text (Markdown allowed), not JSON
+
+---
+
+"""
+
+
+def build_final_synthesis_messages(
+    user_query: str,
+    round_responses: List[Dict[str, Any]]
+) -> List[Dict[str, Any]]:
+    """
+    Build the chairman messages asking for a final answer without convergence.
+
+    Args:
+        user_query: The user's question
+        round_responses: Responses of the last round
+
+    Returns:
+        Message list to send to the chairman
+    """
+    parts = [f"# User's Original Question\n{user_query}\n\n# Council's Final Positions\n"]
+    for result in round_responses:
+        parsed = result.get("parsed_json") or {}
+        position = (
+            parsed.get("final_answer_candidate")
+            or parsed.get("summary")
+            or result.get("response")
+            or ""
+        )
+        parts.append(f"\n## {result['model']}\n{position}\n")
+    return [build_cached_user_message(_FINAL_SYNTHESIS_PROMPT_PREFIX, "".join(parts))]
+
+
+def representative_candidate(round_responses: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Pick the final answer candidate closest to all others (the medoid).
+
+    Args:
+        round_responses: List of model responses for this round
+
+    Returns:
+        Dict with 'model' and 'candidate', or None if no model gave a candidate
+    """
+    candidates = []
+    for result in round_responses:
+        candidate = (result.get('parsed_json') or {}).get('final_answer_candidate')
+        if isinstance(candidate, str) and candidate.strip():
+            words = frozenset(_WORD_RE.findall(candidate.lower()))
+            candidates.append((result['model'], candidate, words))
+    if not candidates:
+        return None
+
+    model, candidate, _ = max(
+        candidates,
+        key=lambda item: sum(candidate_similarity(item[2], other[2]) for other in candidates)
+    )
+    return {"model": model, "candidate": candidate}
+
+
+async def unconverged_final_result(
+    user_query: str,
+    chairman_assessment: Dict[str, Any],
+    round_responses: List[Dict[str, Any]]
+) -> Dict[str, str]:
+    """
+    Build the final result of a discussion that ended without convergence.
+
+    Uses the chairman's conclusion if it wrote one; otherwise asks the chairman
+    (and its fallbacks) to synthesize an answer from the last round, then falls
+    back to the most representative council candidate.
+
+    Args:
+        user_query: The user's question
+        chairman_assessment: The last chairman assessment
+        round_responses: Responses of the last round
+
+    Returns:
+        Dict with 'model' and 'response'
+    """
+    conclusion = chairman_assessment.get("final_integrated_conclusion")
+    if isinstance(conclusion, str) and conclusion.strip():
+        return {
+            "model": chairman_assessment.get("conclusion_model", CHAIRMAN_MODEL),
+            "response": conclusion
         }
+
+    if round_responses:
+        messages = build_final_synthesis_messages(user_query, round_responses)
+        for chairman_model in (CHAIRMAN_MODEL, *CHAIRMAN_FALLBACK_MODELS):
+            response = await query_model(chairman_model, messages)
+            content = ((response or {}).get("content") or "").strip()
+            if content:
+                return {"model": chairman_model, "response": content}
+            logger.warning("Chairman %s failed to synthesize a final answer", chairman_model)
+
+    candidate = representative_candidate(round_responses)
+    if candidate is not None:
+        return {"model": candidate["model"], "response": candidate["candidate"]}
+
+    return {
+        "model": CHAIRMAN_MODEL,
+        "response": "The council did not converge on an answer. See the discussion rounds for each model's position."
     }
 
-    # Check if converged after divergent phase
-    if chairman_assessment.get("is_converged", False):
-        print(f"\n=== Converged after divergent phase ===")
-        final_result = {
-            "model": CHAIRMAN_MODEL,
-            "response": chairman_assessment.get("final_integrated_conclusion", "")
-        }
 
-        yield {
-            "type": "complete",
-            "data": {
-                "all_rounds": all_rounds_results,
-                "stage2": [],  # No stage2 in multi-round format
-                "final_result": final_result,
-                "metadata": {"converged_round": 1}
-            }
-        }
+async def run_full_council_stream(user_query: str):
+    """
+    Run the complete multi-round council process with streaming output.
 
-        # Yield final results for storage
-        yield {
-            "type": "final_results",
-            "data": {
-                "all_rounds": all_rounds_results,
-                "stage2": [],  # No stage2 in multi-round format
-                "final_result": final_result,
-                "metadata": {"converged_round": 1}
-            }
-        }
-        return
+    While the chairman's assessment is streaming, the next convergent round is
+    started speculatively as soon as the chairman has committed to "not converged"
+    and its guidance fields are complete. The speculative queries are reused if
+    the final assessment matches, and cancelled otherwise.
 
-    # Update previous chairman assessment for next round
-    previous_chairman_assessment = chairman_assessment
+    Likewise, the chairman starts speculatively once only one council model is
+    still outstanding. If that straggler responds within CHAIRMAN_SPECULATION_GRACE
+    seconds the chairman is restarted with all responses; otherwise the straggler
+    is cancelled and the speculative assessment is kept, its events forwarded as
+    they stream.
 
-    # Continue with convergent phases
-    current_round = 2
-    while current_round <= max_rounds:
-        print(f"\n=== Round {current_round}: Convergent Phase ===")
+    Args:
+        user_query: The user's question
 
-        # Yield round start event
-        yield {
-            "type": "round_start",
-            "data": {
-                "round": current_round,
-                "type": "convergent",
-                "message": f"Starting convergent phase round {current_round}..."
-            }
+    Yields:
+        Dict events for each stage of completion
+    """
+    # IMMEDIATE YIELD to avoid timeout - let frontend know we're starting
+    yield {
+        "type": "initializing",
+        "data": {
+            "message": "Initializing multi-round council process...",
+            "user_query": user_query
         }
+    }
 
-        # Run convergent phase with streaming
-        convergent_results = []
-        prompt = build_convergent_prompt(
-            user_query,
-            chairman_assessment["consensus_points"],
-            chairman_assessment["conflict_points"],
-            chairman_assessment["questions_for_next_round"]
-        )
-        messages = [{"role": "user", "content": prompt}]
-
-        # Enhanced debugging for streaming convergent phase
-        print(f"\n{'='*100}", flush=True)
-        print(f"🚀 STREAMING - Round {current_round} Convergent Phase - Parallel Query", flush=True)
-        print(f"📝 Prompt length: {len(prompt)} characters", flush=True)
-        print(f"📤 Sending prompt to all models in parallel...", flush=True)
-        print("─" * 80, flush=True)
-        print(prompt, flush=True)
-        print("─" * 80, flush=True)
-
-        # Query models in parallel but stream individual results
-        responses = await query_models_parallel(COUNCIL_MODELS, messages)
-
-        successful_responses = len([r for r in responses.values() if r is not None])
-        print(f"📊 Parallel query completed: {successful_responses}/{len(COUNCIL_MODELS)} models responded", flush=True)
-
-        for i, (model, response) in enumerate(responses.items()):
-            if response is not None:
-                response_text = response.get('content', '')
-                parsed_json = validate_and_parse_json(response_text, model)
-
-                # Enhanced debugging for each model response
-                print(f"\n📥 Parallel response {i+1}/{successful_responses} from {model}", flush=True)
-                print(f"📊 Response length: {len(response_text)} characters", flush=True)
-                print("─" * 60, flush=True)
-                print(response_text, flush=True)
-                print("─" * 60, flush=True)
-
-                if parsed_json:
-                    print(f"✅ JSON parsing successful for {model}", flush=True)
-                    print(f"📋 Parsed structure: {list(parsed_json.keys())}", flush=True)
-                else:
-                    print(f"⚠️  JSON parsing failed for {model}", flush=True)
+    all_rounds_results = []
+    total_models = len(COUNCIL_MODELS)
+    previous_chairman_assessment = None  # Track previous chairman response
+    previous_round_fingerprint = None  # Detect rounds that repeat the previous one
+    stalled = False
+    chairman_assessment = None
+    speculative_round = None  # (guidance, tasks) for a next round started early
+    speculative_chairman = None  # Chairman task started before the round's last response
+    speculative_events = None  # Queue receiving the speculative chairman's events
+    speculative_responses = 0  # Number of responses the speculative chairman saw
+    pending = set()  # Model queries of the current round still in flight
 
-                result = {
-                    "model": model,
-                    "response": response_text,
-                    "parsed_json": parsed_json
-                }
+    try:
+        for current_round in range(1, MAX_ROUNDS + 1):
+            round_type = "divergent" if current_round == 1 else "convergent"
+            logger.info("Round %d: %s phase", current_round, round_type)
 
-                convergent_results.append(result)
+            # Yield round start event
+            yield {
+                "type": "round_start",
+                "data": {
+                    "round": current_round,
+                    "type": round_type,
+                    "message": (
+                        "Starting divergent phase - gathering initial perspectives..."
+                        if current_round == 1
+                        else f"Starting convergent phase round {current_round}..."
+                    )
+                }
+            }
 
-                # Yield individual model response
-                yield {
-                    "type": "model_response_complete",
-                    "data": {
-                        "round": current_round,
+            if current_round == 1:
+                # Build prompt for all models (no accumulated context)
+                messages = build_divergent_messages(user_query)
+                tasks = None
+            else:
+                guidance = chairman_guidance(chairman_assessment)
+                messages = build_convergent_messages(user_query, *guidance)
+                tasks = None
+
+                # Reuse the speculative queries if the chairman's final guidance matches
+                if speculative_round is not None:
+                    speculative_guidance, speculative_tasks = speculative_round
+                    if speculative_guidance == guidance:
+                        logger.info("Reusing speculative round %d queries", current_round)
+                        tasks = speculative_tasks
+                    else:
+                        logger.info("Discarding speculative round %d queries (guidance changed)", current_round)
+                        for task in speculative_tasks:
+                            task.cancel()
+                    speculative_round = None
+
+            # Enhanced debugging for streaming phase
+            if logger.isEnabledFor(logging.DEBUG):
+                prompt = messages_text(messages)
+                logger.debug(
+                    "Round %d %s prompt (%d characters, sending to %d models in parallel):\n%s",
+                    current_round, round_type, len(prompt), total_models, prompt
+                )
+
+            # Encoded once per round: the request body and the response cache key
+            encoded_messages = encode_messages(messages)
+            if tasks is None:
+                tasks = start_council_queries(encoded_messages)
+
+            # Process and stream individual results as each model finishes,
+            # so the fastest model is shown without waiting for the slowest one.
+            # Once only one model is outstanding, the chairman starts speculatively
+            # on the responses so far; the straggler gets a short grace period.
+            round_results = []
+            received_models = 0
+            pending = set(tasks)
+            loop = asyncio.get_running_loop()
+            round_start = loop.time()
+            round_deadline = round_start + ROUND_DEADLINE
+            response_times = []  # Seconds until each successful response
+            half_council = -(-len(tasks) // 2)
+            deadline_tightened = False
+
+            while pending:
+                timeout = round_deadline - loop.time()
+                if speculative_chairman is not None:
+                    timeout = min(timeout, CHAIRMAN_SPECULATION_GRACE)
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(timeout, 0),
+                    return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if speculative_chairman is not None and loop.time() < round_deadline:
+                        logger.info(
+                            "Round %d: straggler missed the %gs grace period, keeping speculative chairman",
+                            current_round, CHAIRMAN_SPECULATION_GRACE
+                        )
+                    else:
+                        logger.warning(
+                            "Round %d: deadline of %.0fs reached, dropping %d unfinished model queries",
+                            current_round, round_deadline - round_start, len(pending)
+                        )
+                    for task in pending:
+                        task.cancel()
+                    pending = set()
+                    break
+
+                for task in done:
+                    model, response = task.result()
+                    received_models += 1
+                    if response is None:
+                        logger.warning("Model %s failed to respond in %s phase", model, round_type)
+                        continue
+
+                    # Cache hits say nothing about model latency, and re-storing
+                    # them would extend their expiry indefinitely
+                    cached = response.get('cached', False)
+                    if not cached:
+                        response_times.append(loop.time() - round_start)
+                    response_text = response.get('content') or ''
+                    parsed_json, defaulted_fields = validate_and_parse_json(response_text, model)
+                    if parsed_json and not cached:
+                        cache_response(model, encoded_messages, response_text)
+
+                    # Enhanced debugging for response
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Round %d response %d/%d from %s (%d characters, JSON %s):\n%s",
+                            current_round, received_models, total_models, model,
+                            len(response_text), "parsed" if parsed_json else "failed",
+                            response_text
+                        )
+
+                    result = {
                         "model": model,
                         "response": response_text,
                         "parsed_json": parsed_json,
-                        "completed_models": i + 1,
-                        "total_models": successful_responses
+                        "defaulted_fields": defaulted_fields
                     }
-                }
 
-                print(f"✅ Model {model} convergent response completed and yielded", flush=True)
-            else:
-                print(f"❌ Model {model} failed to respond in convergent phase", flush=True)
+                    round_results.append(result)
+
+                    # Yield individual model response
+                    yield {
+                        "type": "model_response_complete",
+                        "data": {
+                            "round": current_round,
+                            "model": model,
+                            # The client renders the raw text only when parsing
+                            # failed, so don't send the response content twice
+                            "response": None if parsed_json else response_text,
+                            "parsed_json": parsed_json,
+                            "completed_models": len(round_results),
+                            "total_models": total_models
+                        }
+                    }
 
-        # Add round to results
-        round_data = {
-            "round": current_round,
-            "type": "convergent",
-            "responses": convergent_results
-        }
-        all_rounds_results.append(round_data)
-
-        # Enhanced debugging for chairman evaluation after convergent phase
-        print(f"\n{'='*100}", flush=True)
-        print(f"🔍 STREAMING - Round {current_round} Convergent Phase Complete - Chairman Evaluation", flush=True)
-        print(f"📊 Total convergent responses: {len(convergent_results)}", flush=True)
-        print(f"📤 Sending convergent responses to chairman: {CHAIRMAN_MODEL}", flush=True)
-        print("─" * 80, flush=True)
-
-        # Evaluate convergence
-        chairman_assessment = await evaluate_convergence(user_query, convergent_results, current_round, previous_chairman_assessment)
-
-        # Add chairman assessment to results
-        round_data["chairman_assessment"] = chairman_assessment
-
-        # Enhanced debugging for chairman assessment
-        convergence_score = chairman_assessment.get("convergence_score", 0.0)
-        is_converged = chairman_assessment.get("is_converged", False)
-        print(f"📋 Chairman assessment complete:", flush=True)
-        print(f"   🎯 Convergence Score: {convergence_score}/1.0", flush=True)
-        print(f"   ✅ Is Converged: {is_converged}", flush=True)
-        print(f"   💭 Consensus Points: {len(chairman_assessment.get('consensus_points', []))}", flush=True)
-        print(f"   ⚡ Conflict Points: {len(chairman_assessment.get('conflict_points', []))}", flush=True)
-        print("─" * 80, flush=True)
-
-        # Yield round complete event
-        yield {
-            "type": "round_complete",
-            "data": {
-                "round": current_round,
-                "type": "convergent",
-                "responses": convergent_results,
-                "chairman_assessment": chairman_assessment,
-                "is_converged": chairman_assessment.get("is_converged", False),
-                "convergence_score": chairman_assessment.get("convergence_score", 0.0)
-            }
-        }
+                # Bound the wait for stragglers by the council's median response time
+                if pending and not deadline_tightened and len(response_times) >= half_council:
+                    deadline_tightened = True
+                    adaptive_deadline = round_start + max(
+                        statistics.median(response_times) * STRAGGLER_DEADLINE_FACTOR,
+                        STRAGGLER_DEADLINE_MIN
+                    )
+                    if adaptive_deadline < round_deadline:
+                        round_deadline = adaptive_deadline
+                        logger.info(
+                            "Round %d: half the council answered, tightening deadline to %.0fs",
+                            current_round, round_deadline - round_start
+                        )
+
+                # Stop waiting once a quorum already agrees: further answers cannot
+                # undo the agreement, so the round converges without the chairman
+                if pending and agreed_candidate(round_results) is not None:
+                    logger.info(
+                        "Round %d: quorum of %d responses agrees, cancelling %d outstanding model queries",
+                        current_round, len(round_results), len(pending)
+                    )
+                    for task in pending:
+                        task.cancel()
+                    pending = set()
+                    break
+
+                if (
+                    speculative_chairman is None
+                    and len(pending) == 1
+                    and round_results
+                ):
+                    logger.info("Round %d: starting chairman speculatively on %d responses", current_round, len(round_results))
+                    speculative_responses = len(round_results)
+                    speculative_events = asyncio.Queue()
+                    speculative_chairman = asyncio.create_task(pump_events(
+                        evaluate_convergence_stream(
+                            user_query, list(round_results), current_round, previous_chairman_assessment
+                        ),
+                        speculative_events
+                    ))
+
+            # If no models responded successfully in the first round, send error
+            if current_round == 1 and not round_results:
+                yield {
+                    "type": "error",
+                    "message": "All models failed to respond. Please try again."
+                }
+                return
 
-        # Check if converged
-        if chairman_assessment.get("is_converged", False):
-            print(f"\n=== Converged after round {current_round} ===")
-            final_result = {
-                "model": CHAIRMAN_MODEL,
-                "response": chairman_assessment.get("final_integrated_conclusion", "")
+            # Add round to results
+            round_data = {
+                "round": current_round,
+                "type": round_type,
+                "responses": round_results
             }
-
-            yield {
-                "type": "complete",
-                "data": {
-                    "all_rounds": all_rounds_results,
-                    "stage2": [],  # No stage2 in multi-round format
-                    "final_result": final_result,
-                    "metadata": {"converged_round": current_round}
+            all_rounds_results.append(round_data)
+
+            # A round that repeats the previous one verbatim would get the same
+            # assessment and guidance again, so the council is stuck: stop here
+            # instead of spending another chairman call and round of queries
+            round_fingerprint = response_fingerprint(round_results)
+            if round_fingerprint == previous_round_fingerprint:
+                logger.info(
+                    "Round %d responses are identical to round %d, stopping without another chairman call",
+                    current_round, current_round - 1
+                )
+                chairman_assessment = previous_chairman_assessment
+                round_data["chairman_assessment"] = chairman_assessment
+                yield {
+                    "type": "round_complete",
+                    "data": {
+                        "round": current_round,
+                        "type": round_type,
+                        "chairman_assessment": chairman_assessment,
+                        "is_converged": chairman_assessment["is_converged"],
+                        "convergence_score": chairman_assessment["convergence_score"]
+                    }
                 }
-            }
+                stalled = True
+                break
+            previous_round_fingerprint = round_fingerprint
+
+            # Enhanced debugging for chairman evaluation
+            logger.debug(
+                "Round %d complete: sending %d %s responses to chairman %s",
+                current_round, len(round_results), round_type, CHAIRMAN_MODEL
+            )
+
+            # Keep the speculative chairman only if no response arrived after it
+            # started; its events are then forwarded live as it streams
+            chairman_stream = None
+            if speculative_chairman is not None:
+                if len(round_results) == speculative_responses:
+                    chairman_stream = drain_events(speculative_events, speculative_chairman)
+                else:
+                    logger.info("Round %d: straggler arrived, restarting chairman with all responses", current_round)
+                    speculative_chairman.cancel()
+                    speculative_chairman = None
+
+            # Evaluate convergence, speculatively starting the next round as soon
+            # as the streamed assessment commits to "not converged"
+            partial_assessment = {}
+            if chairman_stream is None:
+                chairman_stream = evaluate_convergence_stream(
+                    user_query, round_results, current_round, previous_chairman_assessment
+                )
+            async for event in chairman_stream:
+                if event["type"] == "chairman_assessment":
+                    chairman_assessment = event["data"]
+                    continue
+
+                partial_assessment[event["data"]["field"]] = event["data"]["value"]
+
+                # Forward each early field to the client as soon as it is parsed
+                yield event
+
+                # Surface the verdict as soon as it is committed, ahead of the
+                # (often long) final conclusion or next-round questions
+                if event["data"]["field"] == "is_converged":
+                    yield {
+                        "type": "chairman_verdict",
+                        "data": {
+                            "round": current_round,
+                            "is_converged": event["data"]["value"],
+                            "convergence_score": partial_assessment.get("convergence_score")
+                        }
+                    }
 
-            # Yield final results for storage
+                if (
+                    speculative_round is None
+                    and current_round < MAX_ROUNDS
+                    and partial_assessment.get("is_converged") is False
+                ):
+                    guidance = chairman_guidance(partial_assessment)
+                    if guidance is not None:
+                        logger.info("Speculatively starting round %d while chairman finishes", current_round + 1)
+                        speculative_round = (
+                            guidance,
+                            start_council_queries(encode_messages(
+                                build_convergent_messages(user_query, *guidance)
+                            ))
+                        )
+
+            speculative_chairman = None
+
+            # Add chairman assessment to results
+            round_data["chairman_assessment"] = chairman_assessment
+
+            # Every assessment carries the schema fields (see CHAIRMAN_SCHEMA)
+            is_converged = chairman_assessment["is_converged"]
+            convergence_score = chairman_assessment["convergence_score"]
+
+            # Log chairman assessment summary
+            logger.info(
+                "Round %d chairman assessment: score=%s converged=%s consensus=%d conflicts=%d",
+                current_round,
+                convergence_score,
+                is_converged,
+                len(chairman_assessment["consensus_points"]),
+                len(chairman_assessment["conflict_points"])
+            )
+
+            # Yield round complete event
             yield {
-                "type": "final_results",
+                "type": "round_complete",
                 "data": {
-                    "all_rounds": all_rounds_results,
-                    "stage2": [],  # No stage2 in multi-round format
-                    "final_result": final_result,
-                    "metadata": {"converged_round": current_round}
+                    "round": current_round,
+                    "type": round_type,
+                    "chairman_assessment": chairman_assessment,
+                    "is_converged": is_converged,
+                    "convergence_score": convergence_score
                 }
             }
-            return
-
-        # Update previous chairman assessment for next round
-        previous_chairman_assessment = chairman_assessment
 
-        current_round += 1
-
-    # If reached max rounds without convergence
-    print(f"\n=== Reached maximum rounds ({max_rounds}) without convergence ===")
-    final_result = {
-        "model": CHAIRMAN_MODEL,
-        "response": chairman_assessment.get("final_integrated_conclusion", "Maximum rounds reached without convergence")
-    }
+            # Check if converged
+            if is_converged:
+                logger.info("Converged after round %d", current_round)
+                final_result = {
+                    "model": chairman_assessment.get("conclusion_model", CHAIRMAN_MODEL),
+                    "response": chairman_assessment["final_integrated_conclusion"]
+                }
 
+                # Single terminal event; the caller persists all_rounds and forwards the rest
+                yield {
+                    "type": "complete",
+                    "data": {
+                        "all_rounds": all_rounds_results,
+                        "final_result": final_result,
+                        "metadata": {"converged_round": current_round}
+                    }
+                }
+                return
+
+            # Update previous chairman assessment for next round
+            previous_chairman_assessment = chairman_assessment
+
+    finally:
+        # Never leave queries running (convergence or client disconnect)
+        for task in pending:
+            task.cancel()
+        if speculative_chairman is not None:
+            speculative_chairman.cancel()
+        if speculative_round is not None:
+            for task in speculative_round[1]:
+                task.cancel()
+
+    # If reached max rounds (or stalled) without convergence
+    if stalled:
+        logger.info("Council stalled after round %d without convergence", len(all_rounds_results))
+    else:
+        logger.info("Reached maximum rounds (%d) without convergence", MAX_ROUNDS)
+    final_result = await unconverged_final_result(
+        user_query,
+        chairman_assessment,
+        all_rounds_results[-1]["responses"] if all_rounds_results else []
+    )
+
+    # Single terminal event; the caller persists all_rounds and forwards the rest
     yield {
         "type": "complete",
         "data": {
             "all_rounds": all_rounds_results,
-            "stage2": [],  # No stage2 in multi-round format
-            "final_result": final_result,
-            "metadata": {"converged_round": None}
-        }
-    }
-
-    # Yield final results for storage
-    yield {
-        "type": "final_results",
-        "data": {
-            "all_rounds": all_rounds_results,
-            "stage2": [],  # No stage2 in multi-round format
             "final_result": final_result,
             "metadata": {"converged_round": None}
         }
@@ -1,18 +1,33 @@
 """FastAPI backend for LLM Council."""
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from typing import List, Dict, Any
 import uuid
-import json
 import asyncio
+import logging
+import orjson
+from contextlib import asynccontextmanager
 
 from . import storage
 from .council import run_full_council_stream, generate_conversation_title
+from .openrouter import close_http_client, warm_up_http_client
 
-app = FastAPI(title="LLM Council API")
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the OpenRouter connection on startup and release it on shutdown."""
+    warm_up = asyncio.create_task(warm_up_http_client())
+    yield
+    warm_up.cancel()
+    await close_http_client()
+
+
+app = FastAPI(title="LLM Council API", lifespan=lifespan)
 
 # Enable CORS for local development
 app.add_middleware(
@@ -24,6 +39,23 @@ app.add_middleware(
 )
 
 
+def sse_event(event: Dict[str, Any]) -> bytes:
+    """
+    Encode an event as a Server-Sent Events data frame.
+
+    orjson writes UTF-8 bytes directly, which matters for the largest payloads:
+    the full model texts in model_response_complete events and the
+    chairman conclusion in round_complete.
+
+    Args:
+        event: Event dict to send
+
+    Returns:
+        Encoded `data: ...` frame
+    """
+    return b"data: " + orjson.dumps(event) + b"\n\n"
+
+
 class CreateConversationRequest(BaseModel):
     """Request to create a new conversation."""
     pass
@@ -50,6 +82,27 @@ class Conversation(BaseModel):
     messages: List[Dict[str, Any]]
 
 
+async def persist_worker(queue: "asyncio.Queue"):
+    """
+    Apply queued storage writes in order, each in a worker thread.
+
+    A failed write is logged and skipped, so it neither stops later writes nor
+    turns an already delivered answer into an error for the client.
+
+    Args:
+        queue: Queue of (function, *args) tuples; None stops the worker
+    """
+    while True:
+        job = await queue.get()
+        if job is None:
+            return
+        func, *args = job
+        try:
+            await asyncio.to_thread(func, *args)
+        except Exception:
+            logger.exception("Storage write %s failed", func.__name__)
+
+
 @app.get("/")
 async def root():
     """Health check endpoint."""
@@ -63,10 +116,14 @@ async def list_conversations():
 
 
 @app.post("/api/conversations", response_model=Conversation)
-async def create_conversation(request: CreateConversationRequest):
+async def create_conversation(request: CreateConversationRequest, background_tasks: BackgroundTasks):
     """Create a new conversation."""
     conversation_id = str(uuid.uuid4())
     conversation = storage.create_conversation(conversation_id)
+
+    # The first message usually follows shortly; make sure the pooled OpenRouter
+    # connection has not idled out by then
+    background_tasks.add_task(warm_up_http_client)
     return conversation
 
 
@@ -105,46 +162,66 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
     is_first_message = len(conversation["messages"]) == 0
 
     async def event_generator():
+        # Storage writes run in order on a background worker, so file I/O never
+        # blocks the event loop or delays the next council round
+        persist_queue = asyncio.Queue()
+        persist_task = asyncio.create_task(persist_worker(persist_queue))
+
         try:
             # Add user message
-            storage.add_user_message(conversation_id, request.content)
+            persist_queue.put_nowait((storage.add_user_message, conversation_id, request.content))
 
             # Start title generation in parallel (don't await yet)
             title_task = None
             if is_first_message:
                 title_task = asyncio.create_task(generate_conversation_title(request.content))
 
-            # Track final results for storage
-            final_results_data = None
-
             # Run the multi-round council process with streaming
             async for event in run_full_council_stream(request.content):
-                # Capture final_results event for storage
-                if event.get('type') == 'final_results':
-                    final_results_data = event.get('data')
-
-                yield f"data: {json.dumps(event)}\n\n"
-
-            # Save assistant message to storage if final results are available
-            if final_results_data:
-                storage.add_assistant_message(
-                    conversation_id,
-                    final_results_data["all_rounds"],
-                    final_results_data["final_result"]
-                )
-
-            # Wait for title generation if it was started
+                # Persist the complete event's rounds; the client already received
+                # them round by round
+                if event.get('type') == 'complete':
+                    persist_queue.put_nowait((
+                        storage.add_assistant_message,
+                        conversation_id,
+                        event['data']['all_rounds'],
+                        event['data']['final_result']
+                    ))
+                    event = {
+                        'type': 'complete',
+                        'data': {k: v for k, v in event['data'].items() if k != 'all_rounds'}
+                    }
+
+                yield sse_event(event)
+
+                # Send the title as soon as it is ready instead of after the whole discussion
+                if title_task and title_task.done():
+                    title = title_task.result()
+                    title_task = None
+                    persist_queue.put_nowait((storage.update_conversation_title, conversation_id, title))
+                    yield sse_event({'type': 'title_complete', 'data': {'title': title}})
+
+            # Wait for title generation if it is still running
             if title_task:
                 title = await title_task
-                storage.update_conversation_title(conversation_id, title)
-                yield f"data: {json.dumps({'type': 'title_complete', 'data': {'title': title}})}\n\n"
+                persist_queue.put_nowait((storage.update_conversation_title, conversation_id, title))
+                yield sse_event({'type': 'title_complete', 'data': {'title': title}})
+
+            # Make sure everything is stored before reporting completion
+            persist_queue.put_nowait(None)
+            await persist_task
 
             # Send final completion event
-            yield f"data: {json.dumps({'type': 'stream_complete'})}\n\n"
+            yield sse_event({'type': 'stream_complete'})
 
         except Exception as e:
             # Send error event
-            yield f"data: {json.dumps({'type': 'error', 'message': str(e)})}\n\n"
+            yield sse_event({'type': 'error', 'message': str(e)})
+
+        finally:
+            # Let queued writes finish even if the client disconnected
+            if not persist_task.done():
+                persist_queue.put_nowait(None)
 
     return StreamingResponse(
         event_generator(),
@@ -158,4 +235,6 @@ async def send_message_stream(conversation_id: str, request: SendMessageRequest)
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8001)
+    # loop="auto" runs on uvloop where it is installed (see pyproject.toml),
+    # falling back to the default asyncio loop elsewhere
+    uvicorn.run(app, host="0.0.0.0", port=8001, loop="auto")
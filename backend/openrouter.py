@@ -1,13 +1,202 @@
 """OpenRouter API client for making LLM requests."""
 
+import asyncio
+import logging
+import random
 import httpx
-from typing import List, Dict, Any, Optional
-from .config import OPENROUTER_API_KEY, OPENROUTER_API_URL
+import orjson
+from typing import List, Dict, Any, Optional, AsyncIterator, Tuple, Union
+from .config import (
+    OPENROUTER_API_KEY,
+    OPENROUTER_API_URL,
+    COUNCIL_MODELS,
+    MAX_CONCURRENT_REQUESTS,
+    MAX_CONCURRENT_PER_PROVIDER,
+    MAX_RETRIES,
+    RETRY_BACKOFF,
+)
+
+logger = logging.getLogger(__name__)
+
+# Fail fast on unreachable hosts; the read timeout is set per call
+CONNECT_TIMEOUT = 5.0
+
+_HEADERS = {
+    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+    "Content-Type": "application/json",
+}
+
+# Caps in-flight OpenRouter requests across all concurrent conversations
+_request_slots = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+# Caps in-flight requests per upstream provider, created on first use
+_provider_slots: Dict[str, asyncio.Semaphore] = {}
+
+# Transient HTTP statuses worth retrying after a backoff
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Transport failures worth retrying: the request never reached the model, or the
+# pooled HTTP/2 connection was closed underneath it (read timeouts are not retried)
+_RETRY_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.RemoteProtocolError)
+
+# Upper bound in seconds for a server-requested Retry-After delay
+_MAX_RETRY_AFTER = 30.0
+
+# Shared client so every council request reuses pooled connections. With HTTP/2
+# the concurrent council calls are multiplexed over a single TLS connection.
+# Created lazily so it binds to the server's event loop, closed on app shutdown.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Return the shared HTTP client, creating it on first use.
+
+    Returns:
+        Pooled HTTP/2 client used for all OpenRouter requests
+    """
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=True,
+            timeout=httpx.Timeout(120.0, connect=CONNECT_TIMEOUT),
+            limits=httpx.Limits(
+                max_connections=MAX_CONCURRENT_REQUESTS,
+                max_keepalive_connections=len(COUNCIL_MODELS) + 1,
+                keepalive_expiry=300.0,
+            ),
+        )
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client and its pooled connections."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def provider_slots(model: str) -> asyncio.Semaphore:
+    """
+    Return the concurrency limit shared by all models of the same provider.
+
+    Args:
+        model: OpenRouter model identifier (e.g., "openai/gpt-4o")
+
+    Returns:
+        Semaphore for the model's provider
+    """
+    provider = model.split('/', 1)[0]
+    slots = _provider_slots.get(provider)
+    if slots is None:
+        slots = _provider_slots[provider] = asyncio.Semaphore(MAX_CONCURRENT_PER_PROVIDER)
+    return slots
+
+
+def retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+    """
+    Compute how long to wait before retrying a transient failure.
+
+    Args:
+        response: The rate-limited or failed response, or None for a transport error
+        attempt: Zero-based number of the attempt that failed
+
+    Returns:
+        Delay in seconds: the server's Retry-After if given, otherwise
+        exponential backoff with jitter
+    """
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after is not None:
+        try:
+            return min(max(float(retry_after), 0.0), _MAX_RETRY_AFTER)
+        except ValueError:
+            pass
+    return RETRY_BACKOFF * 2 ** attempt + random.uniform(0, RETRY_BACKOFF)
+
+
+async def warm_up_http_client():
+    """
+    Open a pooled connection to OpenRouter ahead of the first real request.
+
+    Only the TCP/TLS handshake (and HTTP/2 negotiation) matters here, so the
+    response status is ignored and failures are merely logged.
+    """
+    try:
+        await get_http_client().head(OPENROUTER_API_URL, headers=_HEADERS)
+    except Exception as e:
+        logger.debug("OpenRouter connection warm-up failed: %s", e)
+
+
+def build_cached_user_message(stable_prefix: str, variable_suffix: str) -> Dict[str, Any]:
+    """
+    Build a user message whose stable prefix is marked for prompt caching.
+
+    Providers that support explicit cache breakpoints (e.g. Anthropic via OpenRouter)
+    honour the `cache_control` marker; providers with automatic prefix caching
+    (OpenAI, DeepSeek) benefit from the prefix being byte-identical across calls.
+
+    Args:
+        stable_prefix: Text that is identical across requests
+        variable_suffix: Per-request text appended after the prefix
+
+    Returns:
+        Message dict with multi-part content
+    """
+    return {
+        "role": "user",
+        "content": [
+            {"type": "text", "text": stable_prefix, "cache_control": {"type": "ephemeral"}},
+            {"type": "text", "text": variable_suffix},
+        ],
+    }
+
+
+def encode_messages(messages: List[Dict[str, Any]]) -> bytes:
+    """
+    Serialize a message list to UTF-8 JSON once so it can be shared across models.
+
+    Args:
+        messages: List of message dicts with 'role' and 'content'
+
+    Returns:
+        JSON array bytes
+    """
+    return orjson.dumps(messages)
+
+
+def build_request_body(
+    model: str,
+    messages: Union[List[Dict[str, Any]], bytes],
+    stream: bool = False
+) -> bytes:
+    """
+    Assemble the chat completion request body as bytes.
+
+    Only the model id is encoded per call; pre-encoded messages (see
+    encode_messages) are spliced in as-is.
+
+    Args:
+        model: OpenRouter model identifier
+        messages: List of message dicts, or their pre-encoded JSON bytes
+        stream: Whether to request a streamed response
+
+    Returns:
+        JSON request body
+    """
+    if not isinstance(messages, bytes):
+        messages = encode_messages(messages)
+
+    return b"".join((
+        b'{"model":', orjson.dumps(model),
+        b',"messages":', messages,
+        b',"stream":true}' if stream else b'}',
+    ))
 
 
 async def query_model(
     model: str,
-    messages: List[Dict[str, str]],
+    messages: Union[List[Dict[str, Any]], bytes],
     timeout: float = 120.0
 ) -> Optional[Dict[str, Any]]:
     """
@@ -15,47 +204,165 @@ async def query_model(
 
     Args:
         model: OpenRouter model identifier (e.g., "openai/gpt-4o")
-        messages: List of message dicts with 'role' and 'content'
+        messages: List of message dicts with 'role' and 'content' (string or content parts),
+            or their pre-encoded JSON bytes from encode_messages()
         timeout: Request timeout in seconds
 
     Returns:
         Response dict with 'content' and optional 'reasoning_details', or None if failed
     """
-    headers = {
-        "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-        "Content-Type": "application/json",
-    }
-
-    payload = {
-        "model": model,
-        "messages": messages,
-    }
+    body = build_request_body(model, messages)
 
     try:
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.post(
-                OPENROUTER_API_URL,
-                headers=headers,
-                json=payload
-            )
-            response.raise_for_status()
-
-            data = response.json()
-            message = data['choices'][0]['message']
-
-            return {
-                'content': message.get('content'),
-                'reasoning_details': message.get('reasoning_details')
-            }
+        # Retries happen while holding the slots, so they never add concurrency
+        async with provider_slots(model), _request_slots:
+            for attempt in range(MAX_RETRIES + 1):
+                try:
+                    response = await get_http_client().post(
+                        OPENROUTER_API_URL,
+                        headers=_HEADERS,
+                        content=body,
+                        timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+                    )
+                except _RETRY_ERRORS as e:
+                    if attempt == MAX_RETRIES:
+                        raise
+                    delay = retry_delay(None, attempt)
+                    logger.warning(
+                        "Model %s request failed (%s), retrying in %.1fs (attempt %d/%d)",
+                        model, e, delay, attempt + 1, MAX_RETRIES
+                    )
+                    await asyncio.sleep(delay)
+                    continue
+
+                if response.status_code not in _RETRY_STATUSES or attempt == MAX_RETRIES:
+                    break
+
+                delay = retry_delay(response, attempt)
+                logger.warning(
+                    "Model %s returned HTTP %d, retrying in %.1fs (attempt %d/%d)",
+                    model, response.status_code, delay, attempt + 1, MAX_RETRIES
+                )
+                await asyncio.sleep(delay)
+        response.raise_for_status()
+
+        # Parse the raw body bytes directly, skipping the str decode
+        data = orjson.loads(response.content)
+        message = data['choices'][0]['message']
+
+        return {
+            'content': message.get('content'),
+            'reasoning_details': message.get('reasoning_details')
+        }
 
     except Exception as e:
-        print(f"Error querying model {model}: {e}")
+        logger.error("Error querying model %s: %s", model, e)
         return None
 
 
+async def query_model_stream(
+    model: str,
+    messages: List[Dict[str, Any]],
+    timeout: float = 120.0
+) -> AsyncIterator[str]:
+    """
+    Query a single model via OpenRouter API with streaming enabled.
+
+    Args:
+        model: OpenRouter model identifier (e.g., "openai/gpt-4o")
+        messages: List of message dicts with 'role' and 'content' (string or content parts)
+        timeout: Request timeout in seconds
+
+    Yields:
+        Content deltas as they arrive. On failure the stream simply ends, so
+        callers treat an empty accumulated response as a failed query.
+    """
+    body = build_request_body(model, messages, stream=True)
+
+    try:
+        # Retries happen while holding the slots, so they never add concurrency
+        async with provider_slots(model), _request_slots:
+            for attempt in range(MAX_RETRIES + 1):
+                streamed = False
+                try:
+                    async with get_http_client().stream(
+                        "POST",
+                        OPENROUTER_API_URL,
+                        headers=_HEADERS,
+                        content=body,
+                        timeout=httpx.Timeout(timeout, connect=CONNECT_TIMEOUT)
+                    ) as response:
+                        # Only retry before anything has been streamed
+                        if response.status_code in _RETRY_STATUSES and attempt < MAX_RETRIES:
+                            delay = retry_delay(response, attempt)
+                            logger.warning(
+                                "Model %s returned HTTP %d, retrying in %.1fs (attempt %d/%d)",
+                                model, response.status_code, delay, attempt + 1, MAX_RETRIES
+                            )
+                        else:
+                            response.raise_for_status()
+
+                            async for line in response.aiter_lines():
+                                # Skip keep-alive comments (": OPENROUTER PROCESSING") and blank lines
+                                if not line.startswith("data: "):
+                                    continue
+
+                                data = line[6:]
+                                if data == "[DONE]":
+                                    break
+
+                                chunk = orjson.loads(data)
+                                if 'error' in chunk:
+                                    raise RuntimeError(chunk['error'].get('message', chunk['error']))
+
+                                choices = chunk.get('choices') or [{}]
+                                delta = choices[0].get('delta', {}).get('content')
+                                if delta:
+                                    streamed = True
+                                    yield delta
+                            return
+                except _RETRY_ERRORS as e:
+                    if streamed or attempt == MAX_RETRIES:
+                        raise
+                    delay = retry_delay(None, attempt)
+                    logger.warning(
+                        "Model %s request failed (%s), retrying in %.1fs (attempt %d/%d)",
+                        model, e, delay, attempt + 1, MAX_RETRIES
+                    )
+
+                await asyncio.sleep(delay)
+
+    except Exception as e:
+        logger.error("Error streaming model %s: %s", model, e)
+
+
+def start_model_queries(
+    models: List[str],
+    messages: Union[List[Dict[str, Any]], bytes]
+) -> List["asyncio.Task[Tuple[str, Optional[Dict[str, Any]]]]"]:
+    """
+    Start querying multiple models in the background.
+
+    Args:
+        models: List of OpenRouter model identifiers
+        messages: List of message dicts to send to each model, or their
+            pre-encoded JSON bytes from encode_messages()
+
+    Returns:
+        List of tasks, each resolving to a (model, response) tuple
+    """
+    # Every model gets the same messages, so encode them once for the fan-out
+    encoded = messages if isinstance(messages, bytes) else encode_messages(messages)
+
+    async def _query(model: str):
+        return model, await query_model(model, encoded)
+
+    return [asyncio.create_task(_query(model)) for model in models]
+
+
 async def query_models_parallel(
     models: List[str],
-    messages: List[Dict[str, str]]
+    messages: List[Dict[str, Any]]
 ) -> Dict[str, Optional[Dict[str, Any]]]:
     """
     Query multiple models in parallel.
@@ -67,8 +374,6 @@ async def query_models_parallel(
     Returns:
         Dict mapping model identifier to response dict (or None if failed)
     """
-    import asyncio
-
     # Create tasks for all models
     tasks = [query_model(model, messages) for model in models]
 
@@ -77,3 +382,53 @@ async def query_models_parallel(
 
     # Map models to their responses
     return {model: response for model, response in zip(models, responses)}
+
+
+async def query_models_as_completed(
+    models: List[str],
+    messages: List[Dict[str, Any]],
+    deadline: Optional[float] = None
+) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Query multiple models in parallel, yielding each result as soon as it arrives.
+
+    Args:
+        models: List of OpenRouter model identifiers
+        messages: List of message dicts to send to each model
+        deadline: Seconds after which models that have not answered are dropped
+
+    Yields:
+        (model, response) tuples in completion order (response is None if failed)
+    """
+    tasks = start_model_queries(models, messages)
+
+    async for result in iterate_as_completed(tasks, deadline):
+        yield result
+
+
+async def iterate_as_completed(
+    tasks: List["asyncio.Task[Tuple[str, Optional[Dict[str, Any]]]]"],
+    deadline: Optional[float] = None
+) -> AsyncIterator[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Yield results of already-started model queries in completion order.
+
+    Args:
+        tasks: Tasks returned by start_model_queries()
+        deadline: Seconds after which tasks that have not finished are cancelled
+
+    Yields:
+        (model, response) tuples in completion order (response is None if failed)
+    """
+    try:
+        for next_done in asyncio.as_completed(tasks, timeout=deadline):
+            yield await next_done
+    except asyncio.TimeoutError:
+        logger.warning(
+            "Round deadline of %gs reached, dropping %d unfinished model queries",
+            deadline, sum(not task.done() for task in tasks)
+        )
+    finally:
+        # Cancel any stragglers if the consumer stops early
+        for task in tasks:
+            task.cancel()
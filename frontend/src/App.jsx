@@ -199,21 +199,53 @@ function App() {
             });
             break;
 
+          case 'chairman_partial':
+            // Chairman field parsed from the still-streaming assessment
+            if (event.data.field === 'convergence_score') {
+              setCurrentConversation((prev) => {
+                const messages = [...prev.messages];
+                const lastMsg = messages[messages.length - 1];
+                lastMsg.loading.current_message =
+                  `Round ${event.data.round}: chairman scored convergence at ${event.data.value}...`;
+                return { ...prev, messages };
+              });
+            }
+            break;
+
+          case 'chairman_verdict':
+            // Chairman committed to a verdict before finishing its assessment
+            setCurrentConversation((prev) => {
+              const messages = [...prev.messages];
+              const lastMsg = messages[messages.length - 1];
+              lastMsg.loading.current_message = event.data.is_converged
+                ? `Round ${event.data.round}: converged, writing final conclusion...`
+                : `Round ${event.data.round}: not converged, preparing next round...`;
+              return { ...prev, messages };
+            });
+            break;
+
           case 'round_complete':
             // Handle round completion
             setCurrentConversation((prev) => {
               const messages = [...prev.messages];
               const lastMsg = messages[messages.length - 1];
 
-              // Update round with chairman assessment
-              if (lastMsg.all_rounds[event.data.round - 1]) {
-                lastMsg.all_rounds[event.data.round - 1].chairman_assessment = {
-                  is_converged: event.data.is_converged,
-                  convergence_score: event.data.convergence_score,
-                  ...event.data.chairman_assessment
+              // Initialize round if no model responded in it
+              if (!lastMsg.all_rounds[event.data.round - 1]) {
+                lastMsg.all_rounds[event.data.round - 1] = {
+                  round: event.data.round,
+                  type: event.data.type,
+                  responses: []
                 };
               }
 
+              // Update round with chairman assessment
+              lastMsg.all_rounds[event.data.round - 1].chairman_assessment = {
+                is_converged: event.data.is_converged,
+                convergence_score: event.data.convergence_score,
+                ...event.data.chairman_assessment
+              };
+
               lastMsg.loading.current_message = `Round ${event.data.round} completed`;
 
               return { ...prev, messages };
@@ -221,12 +253,12 @@ function App() {
             break;
 
           case 'complete':
-            // Handle complete multi-round response
+            // Handle complete multi-round response (rounds were already
+            // accumulated from the per-round events)
             if (event.data) {
               setCurrentConversation((prev) => {
                 const messages = [...prev.messages];
                 const lastMsg = messages[messages.length - 1];
-                lastMsg.all_rounds = event.data.all_rounds;
                 lastMsg.final_result = event.data.final_result;
                 lastMsg.metadata = event.data.metadata;
                 lastMsg.loading.multi_round = false;
@@ -124,7 +124,7 @@ export default function MultiRoundDiscussion({ all_rounds, final_result, metadat
                           <strong>{response.model}</strong>
                         </div>
                         <div className="response-content">
-                          {response.parsed_json ? (
+                          {response.parsed_json && Object.keys(response.parsed_json).length > 0 ? (
                             <div className="json-response">
                               <div className="json-field">
                                 <strong>Summary:</strong> {response.parsed_json.summary}